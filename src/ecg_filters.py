@@ -1,5 +1,5 @@
 from collections import deque
-from typing import Deque, List
+from typing import Deque, Dict, List, Tuple
 from enum import Enum
 
 
@@ -741,14 +741,16 @@ class NotchEcgFilter:
         -0.0007077329552539,
     ]
 
+    # Coefficients per frequency, shared read-only by all instances
+    _COEFFICIENTS: Dict[int, Tuple[float, ...]] = {
+        50: tuple(_AR_NOTCH_50),
+        60: tuple(_AR_NOTCH_60),
+        100: tuple(_AR_NOTCH_100),
+        120: tuple(_AR_NOTCH_120),
+    }
+
     def __init__(self, freq: int):
-        mapping = {
-            50: self._AR_NOTCH_50,
-            60: self._AR_NOTCH_60,
-            100: self._AR_NOTCH_100,
-            120: self._AR_NOTCH_120,
-        }
-        self.ar_notch: List[float] = mapping.get(freq, []).copy()
+        self.ar_notch: Tuple[float, ...] = self._COEFFICIENTS.get(freq, ())
         self.max_notch = len(self.ar_notch)
         self.ar_result = [0.0] * self.max_notch
         self.indx = 0
@@ -856,21 +858,17 @@ class SmoothingFilter:
 
 
 class HiPassFilter:
+    # (HP0, HP1, GAIN) per filter type
+    _COEFFICIENTS: Dict[HPFilterType, Tuple[float, float, float]] = {
+        HPFilterType.HP05: (-0.9878018507, 1.9877269954, 1.006155446),
+        HPFilterType.HP015: (-0.9963349287, 1.9963282000, 1.001837588),
+        HPFilterType.HP005: (-0.9987734371, 1.9987726844, 1.00061384),
+    }
+
     def __init__(self, filter_type: HPFilterType):
-        if filter_type == HPFilterType.HP05:
-            self.HP0 = -0.9878018507
-            self.HP1 = 1.9877269954
-            self.GAIN = 1.006155446
-        elif filter_type == HPFilterType.HP015:
-            self.HP0 = -0.9963349287
-            self.HP1 = 1.9963282000
-            self.GAIN = 1.001837588
-        elif filter_type == HPFilterType.HP005:
-            self.HP0 = -0.9987734371
-            self.HP1 = 1.9987726844
-            self.GAIN = 1.00061384
-        else:
+        if filter_type not in self._COEFFICIENTS:
             raise ValueError(f"Unsupported HP filter type: {filter_type}")
+        self.HP0, self.HP1, self.GAIN = self._COEFFICIENTS[filter_type]
 
         self.NPOLES = 2
         # state arrays length NPOLES+1
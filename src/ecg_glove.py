@@ -1,10 +1,7 @@
-from typing import Dict, TypeVar, Any, cast, Optional, List
+from typing import Dict, TypeVar, Any, cast, Optional, List, Set
 from numpy.typing import NDArray
 import numpy as np
 import neurokit2 as nk
-import matplotlib
-
-matplotlib.use("Agg")  # Use non-interactive backend
 from ecg_processor import EcgQualityProcessor
 from glove_decoder import ECGPacketDecoder
 from ecg_filters import (
@@ -68,31 +65,26 @@ class EcgGlove:
         self.enable_baseline_correction = enable_baseline_correction
         self.enable_smoothing = enable_smoothing
 
-        # Initialize filter components
-        self.hp_filter = HiPassFilter(hp_filter_type)
-
-        # Use MultiNotchFilter if multiple frequencies specified, otherwise single NotchEcgFilter
-        if len(self.filters) > 1:
-            # Filter valid notch frequencies
-            valid_notch_freqs = [f for f in self.filters if f in [50, 60, 100, 120]]
-            if valid_notch_freqs:
-                self.notch = MultiNotchFilter(valid_notch_freqs)
-            else:
-                self.notch = NotchEcgFilter(powerline_freq)
-        else:
-            self.notch = NotchEcgFilter(powerline_freq)
-
-        self.morph = MorphologyFilter()
-
-        # Optional filters
-        if enable_baseline_correction:
-            self.baseline_filter = BaselineFilter(sampling_rate=sampling_rate)
+        # Constructor arguments, diffed by reconfigure()
+        self._params: Dict[str, Any] = {
+            "sampling_rate": sampling_rate,
+            "clean_method": clean_method,
+            "peak_method": peak_method,
+            "filters": self.filters,
+            "spike_removal": spike_removal,
+            "hp_filter_type": hp_filter_type,
+            "powerline_freq": powerline_freq,
+            "enable_baseline_correction": enable_baseline_correction,
+            "enable_smoothing": enable_smoothing,
+            "smoothing_window": smoothing_window,
+        }
+        self._build_filters()
 
-        if enable_smoothing:
-            self.smoothing_filter = SmoothingFilter(window_size=smoothing_window)
         self.raw_signals: Dict[str, NDArray[np.float64]] = {}
         self.lead_signals: Dict[str, NDArray[np.float64]] = {}
         self.cleaned_signals: Dict[str, NDArray[np.float64]] = {}
+        # cleaned_signals of the current lead_signals, by clean method
+        self._clean_cache: Dict[str, Dict[str, NDArray[np.float64]]] = {}
         self.ecg_data = {"raw_signals": {}, "lead_signals": {}, "cleaned_signals": {}}
         self.quality_scores: Dict[str, Dict[str, Any]] = {}
         self.quality_processor = EcgQualityProcessor(sampling_rate=sampling_rate)
@@ -105,68 +97,200 @@ class EcgGlove:
             "function": nk.ecg_peaks,
             "method": peak_method,
             "correct_artifacts": True,
-            "show": True,
         }
         self.delineate_config = {
             "function": nk.ecg_delineate,
             "method": "dwt",  # Default method for wave delineation
         }
 
+    def _build_filters(self) -> None:
+        """(Re)create the filter components, with fresh state, from _params."""
+        params = self._params
+
+        # Initialize filter components
+        self.hp_filter = HiPassFilter(params["hp_filter_type"])
+
+        # Use MultiNotchFilter if multiple frequencies specified, otherwise single NotchEcgFilter
+        if len(self.filters) > 1:
+            # Filter valid notch frequencies
+            valid_notch_freqs = [f for f in self.filters if f in [50, 60, 100, 120]]
+            if valid_notch_freqs:
+                self.notch = MultiNotchFilter(valid_notch_freqs)
+            else:
+                self.notch = NotchEcgFilter(params["powerline_freq"])
+        else:
+            self.notch = NotchEcgFilter(params["powerline_freq"])
+
+        self.morph = MorphologyFilter()
+
+        # Optional filters
+        if self.enable_baseline_correction:
+            self.baseline_filter = BaselineFilter(sampling_rate=self.sampling_rate)
+
+        if self.enable_smoothing:
+            self.smoothing_filter = SmoothingFilter(
+                window_size=params["smoothing_window"]
+            )
+
+    def reconfigure(self, **kwargs: Any) -> Set[str]:
+        """
+        Change processing parameters in place, re-running only the stages
+        of already decoded data that depend on the changed ones.
+
+        Attributes are rebound rather than mutated, so a shallow copy of
+        another instance can be reconfigured without touching the original.
+
+        Args:
+            **kwargs: Any of the constructor arguments.
+
+        Returns:
+            The dirty stages ("filter", "clean", "quality", "process"); empty
+            if nothing changed. quality_scores is cleared when "quality" is
+            dirty, so compute_quality() must be called again.
+
+        Raises:
+            TypeError: If an argument is not a constructor parameter.
+        """
+        unknown = set(kwargs) - set(self._params)
+        if unknown:
+            raise TypeError(f"Unknown EcgGlove parameters: {sorted(unknown)}")
+        if "filters" in kwargs:
+            kwargs["filters"] = kwargs["filters"] or []
+        changed = {k for k, v in kwargs.items() if self._params[k] != v}
+        if not changed:
+            return set()
+
+        self._params = {**self._params, **kwargs}
+        dirty = {"process"}
+        if changed - {"clean_method", "peak_method"}:
+            # Filter settings (or the sampling rate) changed
+            self.sampling_rate = self._params["sampling_rate"]
+            self.filters = self._params["filters"]
+            self.spike_removal = self._params["spike_removal"]
+            self.enable_baseline_correction = self._params[
+                "enable_baseline_correction"
+            ]
+            self.enable_smoothing = self._params["enable_smoothing"]
+            self._build_filters()
+            self.quality_processor = EcgQualityProcessor(
+                sampling_rate=self.sampling_rate
+            )
+            dirty |= {"filter", "clean", "quality"}
+        if "clean_method" in changed:
+            self.clean_config = {
+                **self.clean_config,
+                "method": self._params["clean_method"],
+            }
+            dirty |= {"clean", "quality"}
+        if "peak_method" in changed:
+            self.peak_config = {
+                **self.peak_config,
+                "method": self._params["peak_method"],
+            }
+
+        if self.raw_signals:
+            if "filter" in dirty:
+                self._apply_filters()
+            if "clean" in dirty:
+                self._clean_signals()
+        if "quality" in dirty:
+            self.quality_scores = {}
+        return dirty
+
     def decode_data(self, data_bytes: bytes) -> None:
         """
         Decode raw byte data from the ECG glove into individual lead signals.
         Populates raw_signals, lead_signals (filtered), and cleaned_signals.
 
         Args:
-            data_bytes: Byte string from ECG glove.
+            data_bytes: Bytes-like buffer from ECG glove (bytes, mmap, ...).
 
         Raises:
             ValueError: If no valid ECG data is found in the byte stream.
         """
         decoder = ECGPacketDecoder()
-        # Decode the data using the ECGPacketDecoder
-        decoded_leads = decoder.decode(data_bytes)
+        # Decode the data using the ECGPacketDecoder, a chunk at a time so
+        # its temporaries only span one chunk
+        decoded_leads = decoder.decode_chunked(data_bytes)
         if not decoded_leads:
             raise ValueError("No valid ECG data found in the provided byte stream.")
 
         # Store raw signals first
-        self.raw_signals = {
-            lead: np.array(signal_data, dtype=np.float64)
-            for lead, signal_data in decoded_leads.items()
-        }
+        self.raw_signals = decoded_leads
+
+        self._apply_filters()
+        self._clean_signals()
 
+    def _apply_filters(self) -> None:
+        """Filter raw_signals into lead_signals."""
         # Apply filters to get lead signals
-        self.lead_signals = {}
+        lead_signals = {}
         for lead, signal_data in self.raw_signals.items():
             # First apply bandpass filter
             filtered = self._filter_signal(signal_data)
-            self.lead_signals[lead] = filtered
+            lead_signals[lead] = filtered
+        self.lead_signals = lead_signals
+        self._clean_cache = {}
+
+    def _clean_signals(self) -> None:
+        """
+        Clean lead_signals into cleaned_signals and update ecg_data. Signals
+        already cleaned with the same method are reused.
+        """
+        method = self.clean_config["method"]
+        cleaned = self._clean_cache.get(method)
+        if cleaned is None:
+            cleaned = self._clean_leads(method)
+            # Rebound rather than mutated, like every attribute reconfigure()
+            # touches, so shallow copies do not share new entries
+            self._clean_cache = {**self._clean_cache, method: cleaned}
+        self.cleaned_signals = cleaned
 
-        # Clean the filtered signals
-        if self.clean_config["method"] == "none":
+        # Update ecg_data dictionary
+        self.ecg_data = {
+            "raw_signals": self.raw_signals,
+            "lead_signals": self.lead_signals,
+            "cleaned_signals": self.cleaned_signals,
+        }
+
+    def _clean_leads(self, method: str) -> Dict[str, NDArray[np.float64]]:
+        """Clean every lead of lead_signals with the given method."""
+        if method == "none":
             # If no cleaning method is selected, use filtered signals as cleaned signals
-            self.cleaned_signals = {
+            return {
                 lead: signal_data.copy()
                 for lead, signal_data in self.lead_signals.items()
             }
-        else:
-            # Apply the selected cleaning method
-            self.cleaned_signals = {
-                lead: np.array(
-                    nk.ecg_clean(
-                        signal_data,
-                        sampling_rate=self.sampling_rate,
-                        method=self.clean_config["method"],
-                    ),
-                    dtype=np.float64,
-                )
-                for lead, signal_data in self.lead_signals.items()
-            }
 
-        # Update ecg_data dictionary
-        self.ecg_data["raw_signals"] = self.raw_signals
-        self.ecg_data["lead_signals"] = self.lead_signals
-        self.ecg_data["cleaned_signals"] = self.cleaned_signals
+        # Apply the selected cleaning method. ecg_clean already returns
+        # float64; only the methods that return a reversed view are copied
+        return {
+            lead: np.ascontiguousarray(
+                nk.ecg_clean(
+                    signal_data,
+                    sampling_rate=self.sampling_rate,
+                    method=method,
+                ),
+                dtype=np.float64,
+            )
+            for lead, signal_data in self.lead_signals.items()
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Signals cleaned with other methods are not pickled (they would
+        # multiply the size of cached analyses); copy.copy keeps them
+        state = self.__dict__.copy()
+        del state["_clean_cache"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._clean_cache = {}
+
+    def __copy__(self) -> "EcgGlove":
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        return new
 
     def process(self) -> Dict[str, Any]:
         """
@@ -212,9 +336,9 @@ class EcgGlove:
             ecg_data = self._process_waves(primary_lead_name)
 
             return {
-                "AnalysisLead": primary_lead_name,
+                "AnalysisLead": ecg_data["lead"],
                 "ecgData": ecg_data,
-                "quality": self.quality_scores[primary_lead_name],
+                "quality": self.quality_scores[ecg_data["lead"]],
             }
 
         except Exception as err:
@@ -388,6 +512,7 @@ class EcgGlove:
 
         Returns:
             A dict with keys:
+              - "lead": the lead measured
               - "signals": raw and cleaned signals
               - "info": peak locations, heart rate, etc.
               - "waves": p/q/t onsets & offsets
@@ -395,42 +520,43 @@ class EcgGlove:
         """
         self._validate_signal_data()
 
-        # cleaned = self.cleaned_signals with I , III and primary lead
+        # cleaned = self.cleaned_signals with I, II, III and primary lead
         cleaned = {
             lead: self.cleaned_signals[lead]
-            for lead in ["I", "III", primaryLeadName]
+            for lead in ["I", "II", "III", primaryLeadName]
             if lead in self.cleaned_signals
         }
 
-        # 1. Detect peaks and compute heart rate
-        #    We'll store per-lead results, but often just lead II is enough.
+        # 1. Detect peaks and compute heart rate on the candidate leads,
+        #    I and II (or the primary lead if neither was recorded)
+        candidates = [name for name in ("II", "I") if name in cleaned] or [
+            primaryLeadName
+        ]
         peak_results = {}
-        for lead, sig in cleaned.items():
+        for lead in candidates:
             fn = self.peak_config["function"]  # Use get instead of pop
             kwargs = {
                 "sampling_rate": self.sampling_rate,
                 **{k: v for k, v in self.peak_config.items() if k != "function"},
             }
-            signals, info = fn(sig, **kwargs)
+            signals, info = fn(cleaned[lead], **kwargs)
             peak_results[lead] = (signals, info)
 
-        # 2. Delineate waves
-        waves_results = {}
-        for lead, (signals, info) in peak_results.items():
-            fn = self.delineate_config["function"]  # Use get instead of pop
-            kwargs = {
-                "sampling_rate": self.sampling_rate,
-                "method": self.delineate_config.get("method", "dwt"),
-            }
-            _, waves = fn(cleaned[lead], info["ECG_R_Peaks"], **kwargs)
-            waves_results[lead] = waves
-
-        # 3. Compute measurements for your chosen lead
-        #    (Or loop over all leads if you like.)
-        #    Here, pick lead II if available:
-        lead = "II" if "II" in cleaned else next(iter(cleaned))
+        # 2. Choose the lead to measure: the candidate with more R-peaks
+        #    detected; ties go to lead II
+        lead = max(
+            candidates,
+            key=lambda name: np.count_nonzero(peak_results[name][0]["ECG_R_Peaks"]),
+        )
         signals, info = peak_results[lead]
-        waves = waves_results[lead]
+
+        # 3. Delineate waves on the chosen lead
+        fn = self.delineate_config["function"]  # Use get instead of pop
+        kwargs = {
+            "sampling_rate": self.sampling_rate,
+            "method": self.delineate_config.get("method", "dwt"),
+        }
+        _, waves = fn(cleaned[lead], info["ECG_R_Peaks"], **kwargs)
 
         # extract wave points
         wave_points = {
@@ -451,6 +577,7 @@ class EcgGlove:
         measurements.update(wave_axes)
 
         return {
+            "lead": lead,
             "raw_signal": self.lead_signals[lead],
             "cleaned_signal": cleaned[lead],
             "signals": signals,
@@ -1,13 +1,38 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
 from scipy.signal import butter, filtfilt, welch
 import neurokit2 as nk
-from typing import Dict, Any, TypedDict
+from typing import Dict, Any, Tuple, TypedDict
 import warnings
 import pandas as pd
 from numpy.typing import NDArray
 
 warnings.filterwarnings("ignore")
 
+# Lead quality analyses run on one executor shared by all analyses, so
+# concurrent ones (e.g. from several GUI worker threads) queue their leads
+# instead of each starting threads of their own
+_QUALITY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="lead-quality"
+)
+
+
+@lru_cache(maxsize=8)
+def _snr_bandpass(
+    sampling_rate: int,
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    (b, a) of the 0.5-40 Hz Butterworth band-pass that separates signal from
+    noise for the SNR estimate, designed once per sampling rate. The arrays
+    are shared between callers, so they are read-only.
+    """
+    b, a = butter(2, [0.5, 40], btype="bandpass", fs=sampling_rate, output="ba")  # type: ignore
+    b.flags.writeable = False
+    a.flags.writeable = False
+    return b, a
+
 
 class LeadData(TypedDict):
     """Type definition for lead data structure."""
@@ -117,10 +142,10 @@ class EcgQualityProcessor:
 
         # 5. Signal-to-noise ratio (SNR)
         signal_amplitude = np.max(signal) - np.min(signal)
-        b, a = butter(2, [0.5, 40], btype="bandpass", fs=self.sampling_rate, output="ba")  # type: ignore
+        b, a = _snr_bandpass(self.sampling_rate)
         clean_signal = filtfilt(b, a, signal)
         noise = signal - clean_signal
-        noise_power = np.mean(noise**2)
+        noise_power = np.mean(np.square(noise, out=noise))
         snr = 10 * np.log10(signal_amplitude**2 / (noise_power + 1e-10))
 
         results["SNR_dB"] = float(snr)
@@ -164,7 +189,7 @@ class EcgQualityProcessor:
         total_weighted_quality = 0.0
         total_weights = 0.0
 
-        # Analyze each lead's quality and measurements
+        leads = []
         for lead_name, raw_signal in data["lead_signals"].items():
             if lead_name not in data["cleaned_signals"]:
                 print(f"Warning: No cleaned signal for lead {lead_name}")
@@ -177,9 +202,23 @@ class EcgQualityProcessor:
                 print(f"Warning: Empty signal for lead {lead_name}")
                 continue
 
+            leads.append((lead_name, raw_signal, cleaned_signal))
+
+        # Leads are independent, so they are analyzed concurrently; only the
+        # SciPy/NumPy parts release the GIL, so the gain is partial. Results
+        # are combined in lead order
+        futures = [
+            _QUALITY_EXECUTOR.submit(
+                self.analyze_lead_quality, raw_signal, cleaned_signal
+            )
+            for _, raw_signal, cleaned_signal in leads
+        ]
+
+        # Analyze each lead's quality and measurements
+        for (lead_name, _, _), future in zip(leads, futures):
             try:
                 # Quality analysis
-                quality_results = self.analyze_lead_quality(raw_signal, cleaned_signal)
+                quality_results = future.result()
                 results["lead_quality"][lead_name] = quality_results
 
                 # Calculate quality score (0-1)
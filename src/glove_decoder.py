@@ -1,7 +1,59 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
+try:
+    from numba import njit, types
+except ImportError:  # numba is optional; fall back to the NumPy packet search
+    njit = None
+
+
+# raw channel index for each directly-measured lead
+RAW_LEADS = {
+    "I": 0,
+    "III": 1,
+    "V1": 2,
+    "V2": 3,
+    "V3": 4,
+    "V4": 5,
+    "V5": 6,
+    "V6": 7,
+}
+
+
+def _leads_from_samples(samples: NDArray[np.int16]) -> Dict[str, NDArray[np.float64]]:
+    """
+    Convert an (n_frames, n_channels) block of raw samples to standard ECG
+    leads.
+    """
+    # — map raw channels → leads —
+    leads = {
+        lead: samples[:, channel].astype(np.float64)
+        for lead, channel in RAW_LEADS.items()
+    }
+
+    # — derive remaining standard leads —
+    # Each is built in one output array; halving is an exact multiply by 0.5
+    if len(samples) > 0:
+        lead_i = leads["I"]
+        lead_ii = leads["II"] = lead_i + leads["III"]
+        leads["aVR"] = np.add(lead_i, lead_ii)
+        leads["aVR"] *= -0.5
+        leads["aVL"] = np.multiply(lead_ii, 0.5)
+        np.subtract(lead_i, leads["aVL"], out=leads["aVL"])
+        leads["aVF"] = np.multiply(lead_i, 0.5)
+        np.subtract(lead_ii, leads["aVF"], out=leads["aVF"])
+
+    return leads
+
+
+def _span_sums(
+    data: NDArray[np.uint8], starts: NDArray[np.intp], length: int
+) -> NDArray[np.uint8]:
+    """Byte sums modulo 256 of data[start : start + length] for each start."""
+    bounds = np.stack([starts, starts + length], axis=1).ravel()
+    return np.add.reduceat(data, bounds, dtype=np.uint8)[::2]
+
 
 class ECGPacketDecoder:
     PC_ADDR = 0x80  # Destination = PC
@@ -9,14 +61,22 @@ class ECGPacketDecoder:
     TYPE_DATA = 0x00  # Transfer type = Data
     DATA_SUBTYPE = 0x51  # header[5] == 0x51 ⇒ 81-byte ECG payload
     HEADER_LEN = 7  # bytes in the header
+    N_CHANNELS = 8  # 16-bit little-endian samples per frame, one per channel
+    FRAMES_PER_PACKET = (DATA_SUBTYPE - 1) // (2 * N_CHANNELS)
+
+    # Longest span read from a packet start: header, ECG payload, checksum
+    MAX_PACKET_LEN = HEADER_LEN + DATA_SUBTYPE + 1
 
     def __init__(self):
-        # 8 channels: 0→Lead I, 1→Lead III, …, 7→Lead V6
-        self.leads: Dict[int, List[int]] = {ch: [] for ch in range(8)}
+        # decoded (n_frames, 8) sample blocks, one per fed buffer;
+        # channel 0→Lead I, 1→Lead III, …, 7→Lead V6
+        self.samples: List[NDArray[np.int16]] = []
+        self.reset()
 
     def reset(self):
         """Clear out any previously-decoded samples."""
-        self.leads: Dict[int, List[int]] = {ch: [] for ch in range(8)}
+        self.samples = []
+        self._packet_type = 0
 
     def decode(self, buf: bytes) -> Dict[str, NDArray[np.float64]]:
         """Decode ECG data and return lead signals."""
@@ -24,87 +84,240 @@ class ECGPacketDecoder:
         self.feed(buf)  # Process the data
         return self.get_leads()  # Return the processed leads
 
-    def feed(self, buf: bytes):
-        size = len(buf)
+    def decode_chunked(self, buf: bytes, chunk: int = 1 << 20) -> Dict[str, NDArray[np.float64]]:
+        """
+        Decode ECG data like decode(buf), but about ``chunk`` bytes at a
+        time so the decoder's temporaries only span one chunk. The samples
+        are written into one array preallocated for the most packets buf
+        can hold.
+        """
+        self.reset()
+        chunk = max(chunk, 2 * self.MAX_PACKET_LEN)
+        samples = np.empty(
+            (len(buf) // _PACKET_LEN * self.FRAMES_PER_PACKET, self.N_CHANNELS),
+            dtype="<i2",
+        )
+        n_frames = 0
+        with memoryview(buf) as view:
+            size = len(view)
+            pos = 0
+            while True:
+                end = min(pos + chunk, size)
+                final = end == size
+                data, starts, consumed = self._scan(view[pos:end], final)
+                frames = starts.size * self.FRAMES_PER_PACKET
+                self._payloads(data, starts, samples[n_frames : n_frames + frames])
+                n_frames += frames
+                pos += consumed
+                if final:
+                    return _leads_from_samples(samples[:n_frames])
+
+    def feed(self, buf: bytes, final: bool = True) -> int:
+        """
+        Decode the packets in buf, appending their samples to self.samples.
+
+        Returns the number of bytes consumed. Unless ``final``, decoding
+        stops before any packet that might extend past the end of buf; the
+        remaining bytes should be fed again with the following data.
+        """
+        data, starts, consumed = self._scan(buf, final)
+        if starts.size:
+            self.samples.append(self._payloads(data, starts))
+        return consumed
+
+    def _scan(
+        self, buf: bytes, final: bool
+    ) -> Tuple[NDArray[np.uint8], NDArray[np.intp], int]:
+        """buf as bytes, the start offsets of its packets and the bytes consumed"""
+        data = np.frombuffer(buf, dtype=np.uint8)
+        # Last position from which a packet is decoded in this call
+        stop = data.size - 11 if final else data.size - self.MAX_PACKET_LEN
+        starts, consumed = self._find_packets(data, stop)
+        return data, starts, consumed
+
+    def _payloads(
+        self,
+        data: NDArray[np.uint8],
+        starts: NDArray[np.intp],
+        out: Optional[NDArray[np.int16]] = None,
+    ) -> NDArray[np.int16]:
+        """(n_frames, 8) samples of the packets at starts, written to out if given"""
+        if out is None:
+            out = np.empty(
+                (starts.size * self.FRAMES_PER_PACKET, self.N_CHANNELS), dtype="<i2"
+            )
+        # Gather every payload at once into the bytes of out, which as
+        # little-endian int16 also sign-extends them. The offsets are always
+        # in range; mode="clip" only spares take() buffering its output
+        offsets = np.arange(self.DATA_SUBTYPE - 1) + self.HEADER_LEN
+        np.take(
+            data,
+            starts[:, None] + offsets,
+            out=out.reshape(starts.size, offsets.size // 2).view(np.uint8),
+            mode="clip",
+        )
+        return out
+
+    def _find_packets(
+        self, data: NDArray[np.uint8], stop: int
+    ) -> Tuple[NDArray[np.intp], int]:
+        """
+        Start offsets of the valid ECG data packets in data, and the number
+        of bytes consumed.
+
+        With numba the bytes are walked one by one in compiled code.
+        Otherwise only PC_ADDR bytes are visited: their header and payload
+        checksums are computed for all of them at once, and what remains is
+        the walk that decides which of them are packet starts, since the
+        packet type carries over from one header to the following packets
+        and a packet's bytes are skipped as a whole.
+        """
+        size = data.size
+        if _walk_packets is not None:
+            starts = np.empty(size // _PACKET_LEN + 1, dtype=np.intp)
+            n, consumed, packet_type = _walk_packets(
+                data, stop, self._packet_type, starts
+            )
+            self._packet_type = int(packet_type)
+            return starts[:n], int(consumed)
+
+        cand = np.flatnonzero(data[: max(stop + 1, 0)] == self.PC_ADDR)
+
+        # Packet type set by a data header at each candidate (-1: no header)
+        ptype = np.full(cand.size, -1, dtype=np.int16)
+        is_header = (data[cand + 1] == self.UNIT_ADDR) & (
+            data[cand + 2] == self.TYPE_DATA
+        )
+        hdr = cand[is_header]
+        if hdr.size:
+            hdr_sum = _span_sums(data, hdr, self.HEADER_LEN)
+            ptype[is_header] = np.where(hdr_sum == 0, data[hdr + 5], 0)
+
+        # Whether a full, valid ECG payload (data + checksum) follows the
+        # header at each candidate
+        payload_ok = np.zeros(cand.size, dtype=bool)
+        fits = cand + _PACKET_LEN < size
+        if fits.any():
+            pay_sum = _span_sums(data, cand[fits] + self.HEADER_LEN, self.DATA_SUBTYPE)
+            payload_ok[fits] = pay_sum == 0
+
+        positions = cand.tolist()
+        ptypes = ptype.tolist()
+        oks = payload_ok.tolist()
+        packet_type = self._packet_type
+        starts = []
         i = 0
-        packetType = 0
+        k = 0
+        n = len(positions)
+        while i < size:
+            # Frame-sync: next PC_ADDR byte at or after i
+            while k < n and positions[k] < i:
+                k += 1
+            if k == n:
+                # None left up to stop: consumed up to stop, or past it
+                self._packet_type = packet_type
+                if i <= stop:
+                    return np.array(starts, dtype=np.intp), stop + 1
+                return (
+                    np.array(starts, dtype=np.intp),
+                    i if data[i] == self.PC_ADDR else i + 1,
+                )
+
+            i = positions[k]
+            if ptypes[k] >= 0:
+                packet_type = ptypes[k]
+            if packet_type == self.DATA_SUBTYPE:
+                if oks[k]:
+                    starts.append(i)
+                # advance past header + entire payload
+                i += _PACKET_LEN
+            else:
+                # fault packet (type 3) or any other type ⇒ skip one byte
+                i += 1
+
+        self._packet_type = packet_type
+        return np.array(starts, dtype=np.intp), i
+
+    def get_leads(self) -> Dict[str, NDArray[np.float64]]:
+        """Convert raw channel data to standard ECG leads."""
+        if not self.samples:
+            return _leads_from_samples(np.empty((0, self.N_CHANNELS), dtype=np.int16))
+        if len(self.samples) == 1:
+            return _leads_from_samples(self.samples[0])
+        return _leads_from_samples(np.concatenate(self.samples))
+
 
+# Protocol constants as module globals, which numba compiles in as literals
+_PC_ADDR = ECGPacketDecoder.PC_ADDR
+_UNIT_ADDR = ECGPacketDecoder.UNIT_ADDR
+_TYPE_DATA = ECGPacketDecoder.TYPE_DATA
+_DATA_SUBTYPE = ECGPacketDecoder.DATA_SUBTYPE
+_HEADER_LEN = ECGPacketDecoder.HEADER_LEN
+_PACKET_LEN = _HEADER_LEN + _DATA_SUBTYPE
+
+if njit is not None:
+
+    # With an explicit signature the function is compiled, or loaded from
+    # numba's on-disk cache, when the module is imported (in the background
+    # at GUI startup) instead of on the first decode. It releases the GIL,
+    # so files analyzed on different worker threads are walked in parallel
+    @njit(
+        types.Tuple((types.intp, types.intp, types.int64))(
+            types.Array(types.uint8, 1, "C", readonly=True),
+            types.intp,
+            types.int64,
+            types.Array(types.intp, 1, "C"),
+        ),
+        cache=True,
+        boundscheck=False,
+        nogil=True,
+    )
+    def _walk_packets(data, stop, packet_type, starts):
+        """
+        Byte-by-byte packet walk of ECGPacketDecoder.feed, writing the start
+        offset of each valid ECG data packet into starts. Returns the number
+        of packets, the bytes consumed and the packet type carried over.
+        """
+        size = data.size
+        n = 0
+        i = 0
         while i < size:
             # 1) Frame-sync: find 0x80 (PC_ADDR)
-            while i < size and buf[i] != self.PC_ADDR:
+            while i < size and data[i] != _PC_ADDR:
                 i += 1
-                if i > size - 11:  # fewer than 11 bytes left ⇒ stop
-                    return
-            if i > size - 11:
-                return
+                if i > stop:  # too few bytes left ⇒ stop
+                    return n, i, packet_type
+            if i > stop:
+                return n, i, packet_type
 
             # 2) If this looks like a data header, verify its checksum
-            if buf[i + 1] == self.UNIT_ADDR and buf[i + 2] == self.TYPE_DATA:
-                hdr_sum = sum(buf[i + k] for k in range(self.HEADER_LEN)) & 0xFF
-                if hdr_sum == 0:
-                    packetType = buf[i + 5]
+            if data[i + 1] == _UNIT_ADDR and data[i + 2] == _TYPE_DATA:
+                hdr_sum = 0
+                for k in range(_HEADER_LEN):
+                    hdr_sum += data[i + k]
+                if hdr_sum & 0xFF == 0:
+                    packet_type = np.int64(data[i + 5])
                 else:
-                    packetType = 0
-            # else: packetType stays whatever it was
-
-            # 3) Dispatch on packetType
-            if packetType == self.DATA_SUBTYPE:
-                # move past header
-                start = i + self.HEADER_LEN
-
-                # only decode if the full payload+cs fits
-                if start + packetType < size:
-                    block = buf[start : start + packetType]
-                    # block includes (data + 1-byte checksum)
-                    if sum(block) & 0xFF == 0:
-                        data_len = packetType - 1  # drop the final cs byte
-                        # must be whole 16-byte groups (8 leads×2 bytes)
-                        if data_len % 16 == 0:
-                            # decode exactly like computeLead does
-                            for base in range(start, start + data_len, 16):
-                                for ch in range(8):
-                                    lo = buf[base + ch * 2]
-                                    hi = buf[base + ch * 2 + 1]
-                                    val = (hi << 8) | lo
-                                    # two's-complement fix
-                                    if val & 0x8000:
-                                        val -= 0x10000
-                                    self.leads[ch].append(val)
-
-                # advance past header + entire payload
-                i += self.HEADER_LEN + packetType
-
-            elif packetType == 3:
-                # fault packet
-                i += 1
+                    packet_type = 0
 
+            # 3) Dispatch on packet type
+            if packet_type == _DATA_SUBTYPE:
+                start = i + _HEADER_LEN
+                # only keep it if the full payload + checksum fits and sums
+                # to zero
+                if start + _DATA_SUBTYPE < size:
+                    pay_sum = 0
+                    for k in range(_DATA_SUBTYPE):
+                        pay_sum += data[start + k]
+                    if pay_sum & 0xFF == 0:
+                        starts[n] = i
+                        n += 1
+                i += _PACKET_LEN
             else:
-                # any other packetType ⇒ skip one byte
+                # fault packet (type 3) or any other type ⇒ skip one byte
                 i += 1
 
-    def get_leads(self) -> Dict[str, NDArray[np.float64]]:
-        """Convert raw channel data to standard ECG leads."""
-        # — map raw channels → leads, truncate to shortest —
-        raw = {
-            "I": np.array(self.leads[0], dtype=float),
-            "III": np.array(self.leads[1], dtype=float),
-            "V1": np.array(self.leads[2], dtype=float),
-            "V2": np.array(self.leads[3], dtype=float),
-            "V3": np.array(self.leads[4], dtype=float),
-            "V4": np.array(self.leads[5], dtype=float),
-            "V5": np.array(self.leads[6], dtype=float),
-            "V6": np.array(self.leads[7], dtype=float),
-        }
-        min_len = min(len(arr) for arr in raw.values()) if raw["I"].size > 0 else 0
-        for lead in raw:
-            raw[lead] = raw[lead][:min_len]
-
-        # — derive remaining standard leads —
-        leads = dict(raw)
-        if min_len > 0:
-            leads["II"] = leads["I"] + leads["III"]
-            leads["aVR"] = -(leads["I"] + leads["II"]) / 2
-            leads["aVL"] = leads["I"] - leads["II"] / 2
-            leads["aVF"] = leads["II"] - leads["I"] / 2
-
-        return leads
\ No newline at end of file
+        return n, i, packet_type
+
+else:
+    _walk_packets = None
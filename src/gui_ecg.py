@@ -1,5 +1,15 @@
+import copy
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import mmap
 import os
 import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -9,7 +19,6 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QFileDialog,
     QListWidget,
-    QListWidgetItem,
     QLabel,
     QGroupBox,
     QSplitter,
@@ -19,14 +28,46 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QScrollArea,
 )
-from PyQt5.QtCore import Qt
-import matplotlib.pyplot as plt
+from PyQt5.QtCore import (
+    Qt,
+    QTimer,
+    QObject,
+    QRectF,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QImage, QPainter
+import matplotlib
+
+# Nothing draws through pyplot (NeuroKit only imports it), so pin a
+# non-interactive backend that never probes for a display; the embedded
+# canvases use the QtAgg classes directly
+matplotlib.use("Agg", force=True)
+# Collapse near-colinear vertices of the dense ECG traces before rasterizing
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
+import matplotlib.style
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.backends.backend_qt import NavigationToolbar2QT
 from matplotlib.figure import Figure
 import numpy as np
-from ecg_glove import EcgGlove
-from typing import Optional, Dict, Any
+import joblib
+from joblib import Memory
+from ecg_filters import HPFilterType
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Tuple
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: ecg_glove pulls in NeuroKit, SciPy and
+    # pyplot, which would dominate start-up
+    from ecg_glove import EcgGlove
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; fall back to BLAKE2 fingerprints
+    xxhash = None
 
 # Role to store full file path in QListWidgetItem data
 USER_ROLE = 32  # Qt.UserRole value
@@ -34,9 +75,590 @@ USER_ROLE = 32  # Qt.UserRole value
 # Default settings
 DEFAULT_SIGNAL_COLOR = "#00ffff"  # cyan
 DEFAULT_GRID_COLOR = "#404040"  # dark gray
+PLOT_STYLE = "dark_background"  # applied per figure, not to global rcParams
 VOLTAGE_SCALE = 0.5  # mV per division
+MAX_PLOT_POINTS = 2000  # points per lead after envelope downsampling
+# Longest bucket the compiled envelope kernels are used for; NumPy's per-row
+# reductions are faster beyond it
+FUSED_MAX_BUCKET = 256
+YLIM_BLOCK = 64  # columns per block of the y-limit min/max summary
+INTERACTIVE_RENDER_SCALE = 0.72  # i.e. 72 instead of 100 dpi while panning
+INTERACTION_IDLE_MS = 200  # full resolution again after this much idle time
 APP_VERSION = "1.0.3"
 
+# Fixed lead order for the 6x2 layout, and the same leads in axis order
+_LEAD_ORDER = (
+    ("I", "V1"),
+    ("II", "V2"),
+    ("III", "V3"),
+    ("aVR", "V4"),
+    ("aVL", "V5"),
+    ("aVF", "V6"),
+)
+_LEAD_FLAT = tuple(lead for row in _LEAD_ORDER for lead in row)
+_EMPTY_SIGNAL = np.empty(0, dtype=np.float32)  # placeholder for missing leads
+
+# Application-wide dark theme, parsed once by the QApplication
+_MAIN_QSS = """
+QMainWindow, QWidget {
+    background-color: #2b2b2b;
+    color: #e0e0e0;
+}
+QLabel {
+    color: #e0e0e0;
+    background-color: transparent;
+}
+QPushButton {
+    background-color: #3b3b3b;
+    color: #e0e0e0;
+    border: 1px solid #505050;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #454545;
+}
+QGroupBox {
+    color: #e0e0e0;
+    background-color: #2b2b2b;
+    border: 1px solid #505050;
+    border-radius: 5px;
+    margin-top: 15px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    color: #e0e0e0;
+    background-color: transparent;
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 5px 10px;
+    margin-left: 8px;
+    font-weight: bold;
+}
+QGroupBox::indicator {
+    width: 13px;
+    height: 13px;
+    margin-left: 5px;
+}
+QGroupBox::indicator:unchecked {
+    border: 1px solid #505050;
+    background-color: #2b2b2b;
+}
+QGroupBox::indicator:checked {
+    border: 1px solid #4a9eff;
+    background-color: #4a9eff;
+}
+QComboBox {
+    background-color: #3b3b3b;
+    color: #e0e0e0;
+    border: 1px solid #505050;
+    border-radius: 3px;
+    padding: 5px;
+    margin-top: 5px;
+    font-size: 11px;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+QComboBox::down-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 4px solid #e0e0e0;
+    margin-right: 5px;
+}
+QComboBox QAbstractItemView {
+    background-color: #3b3b3b;
+    color: #e0e0e0;
+    border: 1px solid #505050;
+    selection-background-color: #4a9eff;
+}
+QListWidget {
+    background-color: #2b2b2b;
+    color: #e0e0e0;
+    border: 1px solid #505050;
+}
+QCheckBox {
+    color: #e0e0e0;
+    background-color: transparent;
+}
+QScrollArea {
+    background-color: #2b2b2b;
+    border: 1px solid #505050;
+}
+QScrollArea QWidget {
+    background-color: #2b2b2b;
+}
+QScrollArea QScrollBar:vertical {
+    background-color: #404040;
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollArea QScrollBar::handle:vertical {
+    background-color: #606060;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollArea QScrollBar::handle:vertical:hover {
+    background-color: #707070;
+}
+QTabWidget::pane {
+    background-color: #2b2b2b;
+    border: 1px solid #505050;
+}
+QTabBar::tab {
+    background-color: #3b3b3b;
+    color: #e0e0e0;
+    padding: 5px;
+    border: 1px solid #505050;
+}
+QTabBar::tab:selected {
+    background-color: #454545;
+}
+QSplitter::handle {
+    background-color: #505050;
+}
+QSplitter::handle:horizontal {
+    width: 3px;
+    background-color: #505050;
+}
+QSplitter::handle:vertical {
+    height: 3px;
+    background-color: #505050;
+}
+QSplitter::handle:hover {
+    background-color: #606060;
+}
+"""
+
+# Compact style for the per-tab signal type selector
+_COMBO_QSS = """
+QComboBox#signalTypeCombo {
+    background-color: #3b3b3b;
+    color: #e0e0e0;
+    border: 1px solid #505050;
+    border-radius: 3px;
+    padding: 2px 5px;
+    font-size: 11px;
+}
+QComboBox#signalTypeCombo::drop-down {
+    border: none;
+    width: 20px;
+}
+QComboBox#signalTypeCombo::down-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 4px solid #e0e0e0;
+    margin-right: 5px;
+}
+QComboBox#signalTypeCombo QAbstractItemView {
+    background-color: #3b3b3b;
+    color: #e0e0e0;
+    border: 1px solid #505050;
+    selection-background-color: #4a9eff;
+}
+"""
+
+# Named widgets of the sidebar and of every tab, styled through the app-wide
+# sheet so a new tab does not parse stylesheets of its own
+_WIDGET_QSS = """
+QLabel#sectionTitle {
+    font-weight: bold;
+    color: #e0e0e0;
+    font-size: 12px;
+    margin-bottom: 5px;
+}
+QScrollArea#panelScroll {
+    border: none;
+}
+QLabel#panelText {
+    background-color: #3b3b3b;
+    padding: 10px;
+    border-radius: 5px;
+    font-size: 11px;
+    line-height: 1.2;
+}
+QPushButton#processButton {
+    background-color: #4a9eff;
+    color: white;
+    border: none;
+    padding: 10px;
+    border-radius: 5px;
+    font-weight: bold;
+    margin: 10px 0;
+}
+QPushButton#processButton:hover {
+    background-color: #5ba8ff;
+}
+QPushButton#processButton:disabled {
+    background-color: #666666;
+    color: #999999;
+}
+QLabel#versionLabel {
+    color: #808080;
+    font-size: 10px;
+    padding: 5px;
+}
+"""
+
+# (ecg_glove, quality_results, results) of one analyzed file
+AnalysisResult = Tuple["EcgGlove", Dict[str, Any], Dict[str, Any]]
+
+# On-disk cache of analysis results, keyed on file, contents and
+# configuration. Cached arrays are memory-mapped read-only, so a tab only
+# pages in the samples it actually plots.
+CACHE_DIR = os.path.expanduser("~/.cache/ecg-glove")
+# Trimmed to this size, least recently used results first, on exit
+CACHE_BYTES_LIMIT = "1G"
+_MEM = Memory(CACHE_DIR, mmap_mode="r", verbose=0)
+
+# Modules whose code produces the cached results; _analyze itself is hashed
+# by joblib
+_ANALYSIS_MODULES = ("ecg_glove", "ecg_processor", "ecg_filters", "glove_decoder")
+# Bump when cached results change in a way their sources do not show, e.g.
+# a change of dependency behaviour
+_CACHE_VERSION = 1
+
+# The most recent results are also kept in memory, most recently used last
+RESULTS_CACHE_SIZE = 16
+_RESULTS: "OrderedDict[Tuple[str, str], AnalysisResult]" = OrderedDict()
+_RESULTS_LOCK = threading.Lock()
+# Analyses in progress, set once their result is in _RESULTS (or they failed)
+_PENDING: Dict[Tuple[str, str], threading.Event] = {}
+
+
+@contextmanager
+def _mapped_file(filepath: str):
+    """
+    Map a file read-only, so its bytes are paged in as they are touched
+    instead of being copied into one bytes object up front.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses empty files
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _file_fingerprint(filepath: str) -> str:
+    """Hash of the file contents, only recomputed when the file changes"""
+    st = os.stat(filepath)
+    return _hash_file(os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _hash_file(filepath: str, mtime_ns: int, size: int) -> str:
+    """Hash of the file contents; mtime_ns and size only serve as cache keys"""
+    with _mapped_file(filepath) as data:
+        if xxhash is not None:
+            return xxhash.xxh64(data).hexdigest()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _analysis_version() -> str:
+    """
+    Cache key for the analysis code: _CACHE_VERSION, the sources of the
+    analysis modules and the NeuroKit version, so cached results are not
+    reused once any of them changes.
+    """
+    h = hashlib.blake2b(str(_CACHE_VERSION).encode(), digest_size=16)
+    for name in _ANALYSIS_MODULES:
+        spec = importlib.util.find_spec(name)
+        with open(spec.origin, "rb") as f:
+            h.update(f.read())
+    h.update(importlib.metadata.version("neurokit2").encode())
+    return h.hexdigest()
+
+
+def analyze_file(filepath: str, glove_kwargs: Dict[str, Any]) -> AnalysisResult:
+    """
+    Decode and analyze a .ret file, reusing earlier results for the same
+    file contents and configuration from memory or from the disk cache.
+    """
+    key = (_file_fingerprint(filepath), joblib.hash(glove_kwargs))
+    while True:
+        with _RESULTS_LOCK:
+            if key in _RESULTS:
+                _RESULTS.move_to_end(key)
+                return _RESULTS[key]
+            pending = _PENDING.get(key)
+            if pending is None:
+                _PENDING[key] = threading.Event()
+                # Most recent result for the same contents under another
+                # configuration
+                base = next(
+                    (r for (fp, _), r in reversed(_RESULTS.items()) if fp == key[0]),
+                    None,
+                )
+                break
+        # The same analysis is already running (e.g. a repeated Process
+        # click); wait for its result instead of computing it twice. If it
+        # failed, the loop runs it again here.
+        pending.wait()
+
+    try:
+        result = _analyze(filepath, key[0], glove_kwargs, _analysis_version(), base)
+        with _RESULTS_LOCK:
+            _RESULTS[key] = result
+            while len(_RESULTS) > RESULTS_CACHE_SIZE:
+                _RESULTS.popitem(last=False)
+    finally:
+        with _RESULTS_LOCK:
+            _PENDING.pop(key).set()
+    return result
+
+
+@_MEM.cache(ignore=["base"])
+def _analyze(
+    filepath: str,
+    fingerprint: str,
+    glove_kwargs: Dict[str, Any],
+    analysis_version: str,
+    base: Optional[AnalysisResult] = None,
+) -> AnalysisResult:
+    """
+    Decode and analyze a .ret file. Results are cached on disk, so reopening
+    an unchanged file with the same configuration skips the whole pipeline.
+    ``fingerprint`` and ``analysis_version`` only serve as cache keys.
+
+    ``base`` is an earlier result for the same file contents under another
+    configuration. Its decoded signals are reconfigured instead, so only the
+    stages affected by the changed settings run again.
+    """
+    if base is not None:
+        ecg_glove = copy.copy(base[0])
+        dirty = ecg_glove.reconfigure(**glove_kwargs)
+        quality_results = (
+            ecg_glove.compute_quality() if "quality" in dirty else base[1]
+        )
+        results = ecg_glove.process() if "process" in dirty else base[2]
+        return ecg_glove, quality_results, results
+
+    from ecg_glove import EcgGlove
+
+    ecg_glove = EcgGlove(**glove_kwargs)
+    with _mapped_file(filepath) as data:
+        ecg_glove.decode_data(data)
+
+    # Analyze quality first
+    quality_results = ecg_glove.compute_quality()
+
+    # Analyze ECG if quality is acceptable
+    results = ecg_glove.process()
+    return ecg_glove, quality_results, results
+
+
+# Compiled envelope kernels (plot_kernels), set once _load_plot_kernels has
+# run on a worker thread; the NumPy versions are used until then or without
+# numba
+_fused_envelope = None
+_fused_prepare = None
+
+
+def _load_plot_kernels():
+    """Import, and so compile, the numba plot kernels if numba is available."""
+    global _fused_envelope, _fused_prepare
+    try:
+        import plot_kernels
+    except ImportError:  # numba is optional; keep the NumPy envelope
+        return
+    _fused_envelope = plot_kernels.envelope
+    _fused_prepare = plot_kernels.prepare
+
+
+def _warm_up():
+    """Import the analysis stack and plot kernels ahead of their first use."""
+    importlib.import_module("ecg_glove")
+    _load_plot_kernels()
+
+
+def _envelope_downsample(
+    signal: np.ndarray, bucket: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Reduce each bucket of samples to its (min, max) pair so that peaks
+    survive decimation. A trailing partial bucket is kept. The envelope is
+    returned as float32, the dtype of the plot buffers, or written into
+    ``out`` if given.
+    """
+    if out is None:
+        out = np.empty(2 * -(-signal.size // bucket), dtype=np.float32)
+    if (
+        _fused_envelope is not None
+        and bucket <= FUSED_MAX_BUCKET
+        and signal.dtype == np.float32
+        and signal.flags.c_contiguous
+    ):
+        _fused_envelope(signal, bucket, out)
+        return out
+
+    full = signal.size // bucket
+    blocks = signal[: full * bucket].reshape(full, bucket)
+    blocks.min(axis=1, out=out[0 : 2 * full : 2])
+    blocks.max(axis=1, out=out[1 : 2 * full : 2])
+    if signal.size % bucket:
+        tail = signal[full * bucket :]
+        out[-2] = tail.min()
+        out[-1] = tail.max()
+    return out
+
+
+def _prepare_signal(signal: np.ndarray, bucket: int, env: np.ndarray) -> np.ndarray:
+    """
+    float32 copy of signal, also writing its min/max envelope into env. With
+    numba both come from a single traversal of the signal.
+    """
+    if (
+        _fused_prepare is not None
+        and bucket <= FUSED_MAX_BUCKET
+        and signal.dtype == np.float64
+        and signal.flags.c_contiguous
+    ):
+        src = np.empty(signal.size, dtype=np.float32)
+        if signal.size:
+            _fused_prepare(signal, bucket, src, env)
+        return src
+
+    src = np.asarray(signal, dtype=np.float32)
+    if signal.size:
+        _envelope_downsample(src, bucket, out=env)
+    return src
+
+
+@functools.lru_cache(maxsize=32)
+def _sample_axis(start: int, stop: int, fs: float) -> np.ndarray:
+    """
+    Read-only time axis of samples [start, stop), shared by every lead and
+    by repeated views of the same window.
+    """
+    times = np.arange(start, stop) / fs
+    times.flags.writeable = False
+    return times
+
+
+@functools.lru_cache(maxsize=32)
+def _envelope_axis(
+    start: int, stop: int, fs: float, max_points: int = MAX_PLOT_POINTS
+) -> Tuple[int, np.ndarray]:
+    """
+    Bucket size and shared, read-only time axis of a min/max envelope of
+    samples [start, stop), with one (min, max) pair per bucket.
+    """
+    bucket = -(-(stop - start) // max(max_points // 2, 1))
+    starts = np.arange(start, stop, bucket)
+    ends = np.minimum(starts + bucket, stop)
+    times = np.repeat((starts + ends - 1) / 2, 2) / fs
+    times.flags.writeable = False
+    return bucket, times
+
+
+def _plot_window(
+    signals: List[np.ndarray],
+    start: int,
+    stop: int,
+    fs: float,
+    max_points: int = MAX_PLOT_POINTS,
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Shared time axis and per-signal plot data for samples [start, stop).
+    Windows longer than max_points are reduced to a min/max envelope,
+    with one bucket size for all signals so they share the time axis.
+    """
+    segments = [sig[start:stop] for sig in signals]
+    if stop - start <= max_points:
+        return _sample_axis(start, stop, fs), segments
+
+    bucket, times = _envelope_axis(start, stop, fs, max_points)
+    return times, [
+        _envelope_downsample(seg, bucket) if seg.size else seg for seg in segments
+    ]
+
+
+# Two-column results panel: analysis lead and measurements, quality and axes
+_RESULTS_HTML = """
+<table style='width: 100%; border-collapse: collapse;'>
+    <tr>
+        <td style='width: 50%; vertical-align: top; padding-right: 10px;'>
+            <b>Analysis Lead:</b> {analysis_lead}<br>
+            <br>
+            <b>Measurements:</b><br>
+            {measurements}
+        </td>
+        <td style='width: 50%; vertical-align: top; padding-left: 10px;'>
+            <b>Signal Quality:</b> {quality}<br>
+            <br>
+            <b>Electrical Axes:</b><br>
+            {axes}
+        </td>
+    </tr>
+</table>
+"""
+
+# (measurement key, label, format) in display order; measurements are shown
+# when truthy, axes whenever present
+_MEASUREMENT_FIELDS = (
+    ("HeartRate_BPM", "HR", "{:.1f} BPM"),
+    ("RR_Interval_ms", "RR", "{:.0f} ms"),
+    ("P_Duration_ms", "P", "{:.0f} ms"),
+    ("PR_Interval_ms", "PR", "{:.0f} ms"),
+    ("QRS_Duration_ms", "QRS", "{:.0f} ms"),
+    ("QT_Interval_ms", "QT", "{:.0f} ms"),
+    ("QTc_Interval_ms", "QTc", "{:.0f} ms"),
+)
+_AXIS_FIELDS = (
+    ("P_Axis", "P", "{:.0f}°"),
+    ("QRS_Axis", "QRS", "{:.0f}°"),
+    ("T_Axis", "T", "{:.0f}°"),
+)
+
+
+def _format_results_html(
+    quality_results: Dict[str, Any], results: Dict[str, Any]
+) -> str:
+    """HTML for the results panel of one analysis."""
+    measurements = results.get("ecgData", {}).get("measurements", {})
+    measurements_text = (
+        "<br>".join(
+            f"<b>{label}:</b> {fmt.format(measurements[key])}"
+            for key, label, fmt in _MEASUREMENT_FIELDS
+            if measurements.get(key)
+        )
+        or "No measurements available"
+    )
+    axes_text = (
+        "<br>".join(
+            f"<b>{label}:</b> {fmt.format(measurements[key])}"
+            for key, label, fmt in _AXIS_FIELDS
+            if measurements.get(key) is not None
+        )
+        or "No axis data available"
+    )
+
+    overall_quality = quality_results.get("overall_quality", "Not available")
+    if isinstance(overall_quality, (int, float)):
+        quality_color = (
+            "#6bff6b"
+            if overall_quality > 0.7
+            else "#ffd93d" if overall_quality > 0.4 else "#ff6b6b"
+        )
+        quality_text = (
+            f"<span style='color: {quality_color}'>{overall_quality:.2f}</span>"
+        )
+    else:
+        quality_text = str(overall_quality)
+
+    return _RESULTS_HTML.format(
+        analysis_lead=results["AnalysisLead"],
+        measurements=measurements_text,
+        quality=quality_text,
+        axes=axes_text,
+    )
+
 
 class CollapsibleBox(QGroupBox):
     def __init__(self, title="", parent=None):
@@ -59,6 +681,7 @@ class CollapsibleBox(QGroupBox):
         # Set initial state
         self._on_toggled(self.isChecked())
 
+    @pyqtSlot(bool)
     def _on_toggled(self, checked):
         self.content.setVisible(checked)
         if checked:
@@ -74,6 +697,152 @@ class CollapsibleBox(QGroupBox):
         self.content_layout.addLayout(layout)
 
 
+class AnalysisSignals(QObject):
+    """Signals of an AnalysisJob (a QRunnable cannot emit signals itself)"""
+
+    finished = pyqtSignal(object)  # (ecg_glove, quality_results, results)
+    failed = pyqtSignal(str)
+
+
+class AnalysisJob(QRunnable):
+    """Decode and analyze one file on a QThreadPool worker thread"""
+
+    def __init__(
+        self, filepath: str, glove_kwargs: Dict[str, Any], signals: AnalysisSignals
+    ):
+        super().__init__()
+        self.setAutoDelete(False)  # Kept alive by the tab until it reports back
+        self.filepath = filepath
+        self.glove_kwargs = glove_kwargs
+        self.signals = signals
+        # Set from the GUI thread when the result is no longer wanted
+        self.cancelled = False
+
+    @pyqtSlot()
+    def run(self):
+        # Only the analysis runs here; everything touching Qt widgets or the
+        # embedded figures happens in the GUI thread slots
+        if self.cancelled:
+            return
+        try:
+            result = analyze_file(self.filepath, self.glove_kwargs)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(str(e))
+        else:
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+
+
+class FastQtAggCanvas(FigureCanvasQTAgg):
+    """
+    Qt Agg canvas that paints updates straight from the Agg buffer, instead
+    of first copying the damaged region out of it and erasing the widget.
+
+    The figure can also be rendered at a fraction of the widget's pixel
+    count (see set_render_scale); Qt then upscales the smaller buffer.
+    """
+
+    def __init__(self, figure=None):
+        super().__init__(figure)
+        self._render_scale = 1.0
+        self._full_dpi = self.figure.dpi
+        self._draws_held = False
+
+    @contextmanager
+    def held_draws(self):
+        """Drop draw_idle requests made in the block; the caller repaints."""
+        held, self._draws_held = self._draws_held, True
+        try:
+            yield
+        finally:
+            self._draws_held = held
+
+    def draw_idle(self):
+        if not self._draws_held:
+            super().draw_idle()
+
+    @property
+    def render_scale(self) -> float:
+        return self._render_scale
+
+    def set_render_scale(self, scale: float):
+        """Render the figure at ``scale`` times the full resolution."""
+        if scale == self._render_scale:
+            return
+        if self._render_scale == 1.0:
+            self._full_dpi = self.figure.dpi
+        self.figure.set_dpi(self._full_dpi * scale)
+        self._render_scale = scale
+        self.draw_idle()
+
+    def resizeEvent(self, event):
+        # Figure inches are derived from the current dpi, so resize at full
+        # resolution
+        self.set_render_scale(1.0)
+        super().resizeEvent(event)
+
+    def mouseEventCoords(self, pos=None):
+        x, y = super().mouseEventCoords(pos)
+        if self._render_scale == 1.0:
+            return x, y
+        height = self.figure.bbox.height
+        return x * self._render_scale, height - (height - y) * self._render_scale
+
+    def drawRectangle(self, rect):
+        if rect is not None and self._render_scale != 1.0:
+            rect = [pt / self._render_scale for pt in rect]
+        super().drawRectangle(rect)
+
+    def blit(self, bbox=None):
+        if self._render_scale != 1.0:
+            self.repaint()  # Widget and buffer rects differ; repaint it all
+            return
+        super().blit(bbox)
+
+    def paintEvent(self, event):
+        self._draw_idle()  # Only does something if a draw is pending
+        if not hasattr(self, "renderer"):
+            return
+
+        buf = memoryview(self.buffer_rgba())
+        painter = QPainter(self)
+        try:
+            # The figure background is opaque, so nothing needs erasing
+            qimage = QImage(buf, buf.shape[1], buf.shape[0], QImage.Format_RGBA8888)
+            if self._render_scale != 1.0:
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            # Paint only the damaged rect, taken from the matching part of
+            # the buffer (scaled by the device pixel ratio and render scale)
+            rect = QRectF(event.rect())
+            sx = buf.shape[1] / max(self.width(), 1)
+            sy = buf.shape[0] / max(self.height(), 1)
+            source = QRectF(
+                rect.x() * sx, rect.y() * sy, rect.width() * sx, rect.height() * sy
+            )
+            painter.drawImage(rect, qimage, source)
+            self._draw_rect_callback(painter)
+        finally:
+            painter.end()
+
+
+class EcgNavigationToolbar(NavigationToolbar2QT):
+    """
+    Navigation toolbar whose pan drags leave the repaint to the tab: the
+    stock toolbar queues a full figure draw on every mouse move, while only
+    the tab's (blitted) lines depend on the view.
+    """
+
+    def __init__(self, canvas: FastQtAggCanvas, parent, on_pan):
+        super().__init__(canvas, parent)
+        self._on_pan = on_pan
+
+    def drag_pan(self, event):
+        with self.canvas.held_draws():
+            super().drag_pan(event)
+        self._on_pan()
+
+
 class EcgTab(QWidget):
     def __init__(
         self, filepath: str, config: Optional[Dict[str, Any]] = None, parent=None
@@ -81,10 +850,51 @@ class EcgTab(QWidget):
         super().__init__(parent)
         self.filepath = filepath
         self.config = config or {}
-        self.ecg_glove: Optional[EcgGlove] = None
+        self._cfg_name_cache: Optional[str] = None
+        self._settings_html_cache: Optional[str] = None
+        self._quality_scores: Dict[str, Any] = {}
+        self._quality_cache: Dict[str, Tuple[str, str]] = {}
+        self.ecg_glove: Optional["EcgGlove"] = None
+        self.analysis_job: Optional[AnalysisJob] = None  # pending analysis
+        self._last_result: Optional[AnalysisResult] = None  # shown in results_text
+        self._last_results_html = ""
+        # Signals and quality scores last shown; kept alive so identity checks
+        # cannot be fooled by reused ids
+        self._shown: Optional[Tuple[List[Tuple[str, np.ndarray]], Dict]] = None
         self.axes = []
+        self.lines = []  # signal line per axis, built once (empty for missing leads)
+        self._line_x = []  # (time axis, length) last set as x data of each line
+        self.labels = []  # quality label per axis, built once
+        self._backgrounds = None  # per-axis blit backgrounds
         self._syncing = False
-        self.signals_data = {}  # Store signal data for y-limit calculations
+        self._pending_xlim = None
+
+        # Coalesce bursts of xlim_changed events (pan/zoom drags) into at
+        # most one sync per frame
+        self._xlim_timer = QTimer(self)
+        self._xlim_timer.setSingleShot(True)
+        self._xlim_timer.setInterval(16)
+        self._xlim_timer.timeout.connect(self._do_sync)
+
+        # Pan/zoom renders at reduced resolution until it has been idle for
+        # INTERACTION_IDLE_MS
+        self._interaction_timer = QTimer(self)
+        self._interaction_timer.setSingleShot(True)
+        self._interaction_timer.setInterval(INTERACTION_IDLE_MS)
+        self._interaction_timer.timeout.connect(self._end_interaction)
+        # Plotted signals, stored once for y-limit calculations: a shared time
+        # axis plus one float32 row per lead (in axis order)
+        self.times = np.empty(0)
+        self.signals_matrix = np.empty((0, 0), dtype=np.float32)
+        self.lead_index: Dict[str, int] = {}
+        self._lead_sizes = np.empty(0, dtype=np.intp)
+        self._block_min = np.empty((0, 0), dtype=np.float32)
+        self._block_max = np.empty((0, 0), dtype=np.float32)
+        self._sources: List[np.ndarray] = []
+        self._n_samples = 0
+        # Samples per (min, max) column pair of signals_matrix; 1 when it
+        # holds the samples themselves
+        self._bucket = 1
 
         # Create layout
         layout = QVBoxLayout(self)
@@ -101,46 +911,16 @@ class EcgTab(QWidget):
         signal_type_layout.setContentsMargins(0, 0, 0, 0)
 
         signal_type_title = QLabel("Signal Type")
-        signal_type_title.setStyleSheet(
-            "font-weight: bold; color: #e0e0e0; font-size: 12px; margin-bottom: 5px;"
-        )
+        signal_type_title.setObjectName("sectionTitle")
         signal_type_title.setFixedHeight(20)  # Fixed height for alignment
 
         self.signal_type_combo = QComboBox()
+        self.signal_type_combo.setObjectName("signalTypeCombo")
         self.signal_type_combo.addItems(["Raw", "Filtered", "Cleaned"])
         self.signal_type_combo.setCurrentText("Cleaned")
         self.signal_type_combo.currentTextChanged.connect(self.update_plot)
         self.signal_type_combo.setFixedHeight(30)
         self.signal_type_combo.setMinimumWidth(80)
-        self.signal_type_combo.setStyleSheet(
-            """
-            QComboBox {
-                background-color: #3b3b3b;
-                color: #e0e0e0;
-                border: 1px solid #505050;
-                border-radius: 3px;
-                padding: 2px 5px;
-                font-size: 11px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #e0e0e0;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3b3b3b;
-                color: #e0e0e0;
-                border: 1px solid #505050;
-                selection-background-color: #4a9eff;
-            }
-        """
-        )
 
         signal_type_layout.addWidget(signal_type_title)
         signal_type_layout.addWidget(self.signal_type_combo)
@@ -155,9 +935,7 @@ class EcgTab(QWidget):
         settings_layout.setContentsMargins(0, 0, 0, 0)
 
         settings_title = QLabel("Analysis Configuration")
-        settings_title.setStyleSheet(
-            "font-weight: bold; color: #e0e0e0; font-size: 12px; margin-bottom: 5px;"
-        )
+        settings_title.setObjectName("sectionTitle")
         settings_title.setFixedHeight(20)  # Fixed height for alignment
 
         # Create scrollable area for settings
@@ -168,13 +946,10 @@ class EcgTab(QWidget):
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
         settings_scroll.setMaximumHeight(130)
-        settings_scroll.setStyleSheet("QScrollArea { border: none; }")
+        settings_scroll.setObjectName("panelScroll")
 
         self.settings_label = QLabel()
-        self.settings_label.setStyleSheet(
-            "background-color: #3b3b3b; padding: 10px; border-radius: 5px; "
-            "font-size: 11px; line-height: 1.2;"
-        )
+        self.settings_label.setObjectName("panelText")
         self.settings_label.setWordWrap(True)
         self.settings_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.update_settings_display()
@@ -190,9 +965,7 @@ class EcgTab(QWidget):
         results_layout.setContentsMargins(0, 0, 0, 0)
 
         results_title = QLabel("Analysis Results")
-        results_title.setStyleSheet(
-            "font-weight: bold; color: #e0e0e0; font-size: 12px; margin-bottom: 5px;"
-        )
+        results_title.setObjectName("sectionTitle")
         results_title.setFixedHeight(20)  # Fixed height for alignment
 
         # Create scrollable area for results
@@ -203,13 +976,10 @@ class EcgTab(QWidget):
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
         results_scroll.setMaximumHeight(130)
-        results_scroll.setStyleSheet("QScrollArea { border: none; }")
+        results_scroll.setObjectName("panelScroll")
 
         self.results_text = QLabel()
-        self.results_text.setStyleSheet(
-            "background-color: #3b3b3b; padding: 10px; border-radius: 5px; "
-            "font-size: 11px; line-height: 1.2;"
-        )
+        self.results_text.setObjectName("panelText")
         self.results_text.setWordWrap(True)
         self.results_text.setAlignment(Qt.AlignmentFlag.AlignTop)
 
@@ -227,18 +997,16 @@ class EcgTab(QWidget):
         header_widget.setMinimumHeight(150)
         # Remove maximum height constraint to allow splitter control
 
-        # Add matplotlib figure with navigation toolbar
-        self.figure = Figure(figsize=(12, 8), facecolor="#2b2b2b")
-        self.canvas = FigureCanvasQTAgg(self.figure)
-        self.toolbar = NavigationToolbar2QT(self.canvas, self)
-
-        # Create plot area widget containing toolbar and canvas
+        # Create plot area widget; the matplotlib figure, canvas and toolbar
+        # are only built once the tab is first shown
+        self.figure: Optional[Figure] = None
+        self.canvas: Optional[FastQtAggCanvas] = None
+        self.toolbar: Optional[EcgNavigationToolbar] = None
+        self._needs_plot = False
         plot_widget = QWidget()
-        plot_layout = QVBoxLayout(plot_widget)
-        plot_layout.setContentsMargins(0, 0, 0, 0)
-        plot_layout.setSpacing(0)
-        plot_layout.addWidget(self.toolbar)
-        plot_layout.addWidget(self.canvas)
+        self._plot_layout = QVBoxLayout(plot_widget)
+        self._plot_layout.setContentsMargins(0, 0, 0, 0)
+        self._plot_layout.setSpacing(0)
 
         # Create vertical splitter between header and plots
         vertical_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -259,78 +1027,480 @@ class EcgTab(QWidget):
         # Add splitter to main layout
         layout.addWidget(vertical_splitter)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.canvas is None:
+            self._build_plot_area()
+        if self._needs_plot:
+            self._needs_plot = False
+            self.plot_ecg_data()
+
+    def _build_plot_area(self):
+        """Add matplotlib figure with navigation toolbar"""
+        with matplotlib.style.context(PLOT_STYLE):
+            self.figure = Figure(figsize=(12, 8), facecolor="#2b2b2b")
+        # Set up the figure for maximum space utilization while it has no axes
+        # yet, so there is nothing to reposition (Figure's subplotpars
+        # argument is reset by its own clear())
+        self.figure.subplots_adjust(
+            left=0.02, right=0.98, bottom=0.02, top=0.98, hspace=0.1, wspace=0.1
+        )
+        self.canvas = FastQtAggCanvas(self.figure)
+        self.toolbar = EcgNavigationToolbar(self.canvas, self, self._on_pan)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", self._on_resize)
+        self._plot_layout.addWidget(self.toolbar)
+        self._plot_layout.addWidget(self.canvas)
+
+    def _build_axes(self):
+        """
+        Create the 6x2 grid with one line and one quality label per lead.
+        Done once per tab; replotting only updates these artists.
+        """
+        # Create all subplots at once with minimal styling - only share x-axis,
+        # not y-axis. Artists read their colors from rcParams when created,
+        # so the dark style is only needed while building them
+        with matplotlib.style.context(PLOT_STYLE):
+            self._create_artists()
+
+        # Connect the xlim_changed event to sync function
+        self.axes[0].callbacks.connect("xlim_changed", self._sync_xlim)
+
+    def _create_artists(self):
+        """Create the subplots and their line and label artists."""
+        axs = self.figure.subplots(6, 2, sharex=True, squeeze=False)
+        self.axes = list(axs.flat)
+
+        # Configure axes for maximum signal visibility
+        for ax in self.axes:
+            (line,) = ax.plot(
+                [],
+                [],
+                color=DEFAULT_SIGNAL_COLOR,
+                linewidth=0.8,
+                antialiased=False,
+                animated=True,
+            )
+            # Lead label with quality information
+            label = ax.text(
+                0.02, 0.85, "", transform=ax.transAxes, fontsize=8, alpha=0.8
+            )
+            self.lines.append(line)
+            self.labels.append(label)
+            self._line_x.append((None, 0))
+
+            # Remove all unnecessary elements
+            ax.set_xticks([])
+            ax.set_yticks([])
+            ax.set_frame_on(False)
+            ax.grid(True, alpha=0.1, color=DEFAULT_GRID_COLOR)
+
+    def show_signals(self, signals: Dict[str, np.ndarray]):
+        """
+        Plot signals, keyed by lead in axis order, into the existing lines
+        and reset the view to the whole recording. Showing the very same
+        arrays and quality scores again (a cached result) is a no-op.
+        """
+        if self._is_shown(signals):
+            return
+        if not self.axes:
+            self._build_axes()
+        self._set_line_data(signals)
+        for label, sig in zip(self.labels, signals.values()):
+            label.set_visible(sig.size > 0)
+        self._update_labels()
+        self.toolbar.update()  # the old navigation history no longer applies
+
+        # The one draw for all of the above; labels may have changed, so the
+        # backgrounds need a full draw rather than a blit
+        self.canvas.draw_idle()
+
+    def _is_shown(self, signals: Dict[str, np.ndarray]) -> bool:
+        """Whether signals and the quality scores are exactly what is shown."""
+        if self._shown is None:
+            return False
+        shown, quality = self._shown
+        return (
+            quality is self._quality_scores
+            and len(shown) == len(signals)
+            and all(
+                lead == shown_lead and sig is shown_sig
+                for (lead, sig), (shown_lead, shown_sig) in zip(
+                    signals.items(), shown
+                )
+            )
+        )
+
+    def _set_line_data(self, signals: Dict[str, np.ndarray]):
+        """Swap signals into the lines and show their full time range."""
+        self._shown = (list(signals.items()), self._quality_scores)
+        self.set_signals_data(signals)
+
+        # Set x-limits for all plots and per-lead y-limits from the
+        # precomputed min/max summary, then envelope the lines at the
+        # current pixel width
+        max_time = self.times[-1] if self.times.size > 0 else 0
+        xlim = (0, max(max_time, 1))
+        try:
+            self._syncing = True
+            self.axes[0].set_xlim(xlim)
+            self._update_individual_ylimits(xlim)
+        finally:
+            self._syncing = False
+        self._update_line_detail(xlim)
+
     def _sync_xlim(self, ax):
-        """Synchronize x-axis limits across all plots and update y-limits individually."""
+        """Schedule an x-axis sync; the latest limits win within a frame."""
         if self._syncing:
             return
 
+        self._pending_xlim = ax.get_xlim()
+        if not self._xlim_timer.isActive():
+            self._xlim_timer.start()
+
+    @pyqtSlot()
+    def _do_sync(self):
+        """Follow an x-range change with per-lead y-limits and line detail."""
+        xlim = self._pending_xlim
+        if xlim is None:
+            return
+        self._pending_xlim = None
+
         try:
             self._syncing = True
-            xlim = ax.get_xlim()
-
-            # Update x-limits for all axes
-            for other_ax in self.axes:
-                if other_ax != ax:
-                    other_ax.set_xlim(xlim)
 
-            # Update y-limits individually for each lead based on visible x-range
+            # The axes share x, so matplotlib has already applied xlim to all
+            # of them. Update y-limits individually for each lead based on
+            # the visible x-range
             self._update_individual_ylimits(xlim)
+            self._update_line_detail(xlim)
 
-            self.canvas.draw_idle()
+            self._begin_interaction()
+            self._blit_lines()
         finally:
             self._syncing = False
 
+    def _on_pan(self):
+        """Repaint after a pan step that left the x-range unchanged."""
+        # An x-range change is already scheduled for _do_sync, which blits
+        if self._pending_xlim is None:
+            self._begin_interaction()
+            self._blit_lines()
+
+    def _update_line_detail(self, xlim):
+        """
+        Re-envelope only the visible samples, so zooming in reveals the full
+        detail instead of stretching the overview envelope (the clip-to-view
+        peak downsampling pyqtgraph does).
+        """
+        start, stop = self._sample_range(xlim)
+        times, data = _plot_window(
+            self._sources,
+            start,
+            stop,
+            self.ecg_glove.sampling_rate,
+            self._point_budget(),
+        )
+        # Line2D copies and float-converts whatever it is given, so x data is
+        # only handed over when the (memoized) time axis actually changed
+        for i, (line, signal) in enumerate(zip(self.lines, data)):
+            n = signal.size
+            shown_times, shown_n = self._line_x[i]
+            if shown_times is times and shown_n == n:
+                line.set_ydata(signal)
+            else:
+                line.set_data(times[:n], signal)
+                self._line_x[i] = (times, n)
+
+    def _sample_range(self, xlim) -> Tuple[int, int]:
+        """Sample range [start, stop) covering the x-range xlim (seconds)."""
+        fs = self.ecg_glove.sampling_rate
+        start = min(max(int(np.floor(xlim[0] * fs)), 0), self._n_samples)
+        stop = max(min(int(np.ceil(xlim[1] * fs)) + 1, self._n_samples), start)
+        return start, stop
+
+    def _point_budget(self) -> int:
+        """
+        Plot points per line: one (min, max) pair per device pixel column of
+        an axes, as more points than that only cost rasterization time.
+        """
+        width = int(self.axes[0].bbox.width) if self.axes else 0
+        return min(max(2 * width, 2), MAX_PLOT_POINTS)
+
+    def _begin_interaction(self):
+        """Drop to the interactive render scale and (re)arm the idle timer."""
+        if self.canvas.render_scale != INTERACTIVE_RENDER_SCALE:
+            self._backgrounds = None  # captured at the other resolution
+            self.canvas.set_render_scale(INTERACTIVE_RENDER_SCALE)
+        self._interaction_timer.start()
+
+    @pyqtSlot()
+    def _end_interaction(self):
+        """Return to full resolution once pan/zoom has gone idle."""
+        self._backgrounds = None
+        self.canvas.set_render_scale(1.0)
+        if self._sources:
+            self._update_line_detail(self.axes[0].get_xlim())
+
+    def _on_draw(self, event):
+        """Cache the axes backgrounds after a full draw and paint the lines."""
+        # Lines are animated, so a full draw leaves them out; the background
+        # (no ticks, axes-relative labels) does not depend on the axis limits
+        if event.canvas is self.canvas:
+            self._backgrounds = [
+                self.canvas.copy_from_bbox(ax.bbox) for ax in self.axes
+            ]
+        for line in self.lines:
+            line.draw(event.renderer)
+
+    def _on_resize(self, event):
+        self._backgrounds = None
+        if self._sources:
+            self._update_line_detail(self.axes[0].get_xlim())
+
+    def _blit_lines(self):
+        """Redraw only the signal lines over the cached axes backgrounds."""
+        if self._backgrounds is None or len(self._backgrounds) != len(self.axes):
+            self.canvas.draw_idle()
+            return
+
+        for ax, line, background in zip(self.axes, self.lines, self._backgrounds):
+            self.canvas.restore_region(background)
+            ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
+
     def _update_individual_ylimits(self, xlim):
         """Update y-limits for each lead individually based on visible x-range."""
-        x_min, x_max = xlim
-
-        # Fixed lead order for mapping axes to leads
-        lead_order = [
-            ("I", "V1"),
-            ("II", "V2"),
-            ("III", "V3"),
-            ("aVR", "V4"),
-            ("aVL", "V5"),
-            ("aVF", "V6"),
-        ]
-
-        ax_index = 0
-        for row_leads in lead_order:
-            for lead in row_leads:
-                if ax_index < len(self.axes):
-                    ax = self.axes[ax_index]
-                    times, signal = self.signals_data.get(
-                        lead, (np.array([]), np.array([]))
-                    )
-
-                    if signal.size > 0 and times.size > 0:
-                        # Find indices within visible x-range
-                        visible_mask = (times >= x_min) & (times <= x_max)
-                        if np.any(visible_mask):
-                            visible_signal = signal[visible_mask]
-                            y_min = np.min(visible_signal)
-                            y_max = np.max(visible_signal)
-
-                            # Add margins to y-axis limits
-                            y_range = y_max - y_min
-                            if y_range > 0:
-                                y_min -= 0.1 * y_range
-                                y_max += 0.1 * y_range
-                            else:
-                                # Handle case where signal is flat
-                                y_min -= 0.1
-                                y_max += 0.1
-
-                            ax.set_ylim(y_min, y_max)
-
-                ax_index += 1
+        if self.signals_matrix.size == 0:
+            return
+
+        # The same samples _update_line_detail plots for this x-range
+        start, stop = self._sample_range(xlim)
+        if stop <= start:
+            return
+
+        y_mins, y_maxs = self._visible_minmax(start, stop)
+
+        # Matrix rows are stored in axis order
+        for ax, y_min, y_max in zip(self.axes, y_mins, y_maxs):
+            if np.isnan(y_min):
+                continue
+
+            # Add margins to y-axis limits
+            y_range = y_max - y_min
+            if y_range > 0:
+                y_min -= 0.1 * y_range
+                y_max += 0.1 * y_range
+            else:
+                # Handle case where signal is flat
+                y_min -= 0.1
+                y_max += 0.1
+
+            ax.set_ylim(y_min, y_max)
+
+    def _visible_minmax(self, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-lead min and max of samples [start, stop). Envelope buckets
+        wholly inside the range come from the signal matrix (each holds its
+        bucket's exact min and max); the partial buckets at either end, or a
+        range within a single bucket, are scanned in the full-resolution
+        signals.
+        """
+        bucket = self._bucket
+        if bucket == 1:
+            # The matrix holds the samples themselves
+            return self._range_minmax(start, stop)
+
+        k0 = -(-start // bucket)
+        k1 = stop // bucket
+        if k1 <= k0:
+            return self._sources_minmax(start, stop)
+
+        y_mins, y_maxs = self._range_minmax(2 * k0, 2 * k1)
+        for j0, j1 in ((start, k0 * bucket), (k1 * bucket, stop)):
+            if j1 > j0:
+                edge_mins, edge_maxs = self._sources_minmax(j0, j1)
+                np.fmin(y_mins, edge_mins, out=y_mins)
+                np.fmax(y_maxs, edge_maxs, out=y_maxs)
+        return y_mins, y_maxs
+
+    def _sources_minmax(self, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-lead min and max of samples [start, stop); NaN for no samples."""
+        y_mins = np.full(len(self._sources), np.nan, dtype=np.float32)
+        y_maxs = np.full(len(self._sources), np.nan, dtype=np.float32)
+        for i, sig in enumerate(self._sources):
+            segment = sig[start:stop]
+            if segment.size:
+                y_mins[i] = np.fmin.reduce(segment)
+                y_maxs[i] = np.fmax.reduce(segment)
+        return y_mins, y_maxs
+
+    def _range_minmax(self, i0: int, i1: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-lead min and max over columns [i0, i1) of the signal matrix.
+        Whole blocks are read from the precomputed block summary, so only
+        the two partial edge blocks are scanned sample by sample. fmin/fmax
+        skip the NaN padding of shorter (or empty) leads.
+        """
+        b0 = -(-i0 // YLIM_BLOCK)
+        b1 = i1 // YLIM_BLOCK
+        if b0 >= b1:
+            visible = self.signals_matrix[:, i0:i1]
+            return np.fmin.reduce(visible, axis=1), np.fmax.reduce(visible, axis=1)
+
+        y_mins = np.fmin.reduce(self._block_min[:, b0:b1], axis=1)
+        y_maxs = np.fmax.reduce(self._block_max[:, b0:b1], axis=1)
+        for j0, j1 in ((i0, b0 * YLIM_BLOCK), (b1 * YLIM_BLOCK, i1)):
+            if j1 > j0:
+                edge = self.signals_matrix[:, j0:j1]
+                np.fmin(y_mins, np.fmin.reduce(edge, axis=1), out=y_mins)
+                np.fmax(y_maxs, np.fmax.reduce(edge, axis=1), out=y_maxs)
+        return y_mins, y_maxs
 
     def _sync_ylim(self):
         """Removed - no longer synchronizing y-axis limits."""
         pass
 
+    @property
+    def signals_data(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Per-lead (times, signal) views onto the shared plot buffers."""
+        data = {}
+        for lead, i in self.lead_index.items():
+            n = int(self._lead_sizes[i])
+            data[lead] = (self.times[:n], self.signals_matrix[i, :n])
+        return data
+
+    def set_signals_data(self, signals: Dict[str, np.ndarray]):
+        """
+        Store the signals to plot, keyed by lead in axis order. Long signals
+        are reduced to a min/max envelope of about MAX_PLOT_POINTS points.
+        """
+        # Full-resolution signals, re-enveloped per view when zoomed in. Cast
+        # once to float32, like the plot buffers: half the bytes per pass and
+        # ample precision for the glove's 16-bit samples
+        fs = self.ecg_glove.sampling_rate
+        n_samples = max((sig.size for sig in signals.values()), default=0)
+        self._n_samples = n_samples
+        self.lead_index = {lead: i for i, lead in enumerate(signals)}
+
+        if n_samples <= MAX_PLOT_POINTS:
+            self._bucket = 1
+            self._sources = [
+                np.asarray(sig, dtype=np.float32) for sig in signals.values()
+            ]
+            self.times = _sample_axis(0, n_samples, fs)
+            self._lead_sizes = np.array(
+                [sig.size for sig in self._sources], dtype=np.intp
+            )
+            self.signals_matrix = np.full(
+                (len(signals), self.times.size), np.nan, dtype=np.float32
+            )
+            for i, sig in enumerate(self._sources):
+                self.signals_matrix[i, : sig.size] = sig
+        else:
+            # Cast and envelope each signal in one pass, straight into its
+            # row of the plot matrix
+            bucket, self.times = _envelope_axis(0, n_samples, fs)
+            self._bucket = bucket
+            self._lead_sizes = np.array(
+                [2 * -(-sig.size // bucket) for sig in signals.values()],
+                dtype=np.intp,
+            )
+            self.signals_matrix = np.full(
+                (len(signals), self.times.size), np.nan, dtype=np.float32
+            )
+            self._sources = [
+                _prepare_signal(sig, bucket, self.signals_matrix[i, :n])
+                for i, (sig, n) in enumerate(zip(signals.values(), self._lead_sizes))
+            ]
+
+        # Min/max of each YLIM_BLOCK-column block, for fast y-limit queries.
+        # Whole blocks are reduced through a reshaped view of the matrix, so
+        # only the short trailing block needs a separate reduction
+        n_leads, n_cols = self.signals_matrix.shape
+        full = n_cols // YLIM_BLOCK
+        n_blocks = -(-n_cols // YLIM_BLOCK)
+        self._block_min = np.empty((n_leads, n_blocks), dtype=np.float32)
+        self._block_max = np.empty((n_leads, n_blocks), dtype=np.float32)
+        blocks = self.signals_matrix[:, : full * YLIM_BLOCK].reshape(
+            n_leads, full, YLIM_BLOCK
+        )
+        np.fmin.reduce(blocks, axis=2, out=self._block_min[:, :full])
+        np.fmax.reduce(blocks, axis=2, out=self._block_max[:, :full])
+        if n_blocks > full:
+            tail = self.signals_matrix[:, full * YLIM_BLOCK :]
+            np.fmin.reduce(tail, axis=1, out=self._block_min[:, full])
+            np.fmax.reduce(tail, axis=1, out=self._block_max[:, full])
+
+    @property
+    def quality_scores(self) -> Dict[str, Any]:
+        return self._quality_scores
+
+    @quality_scores.setter
+    def quality_scores(self, scores: Optional[Dict[str, Any]]):
+        self._quality_scores = scores or {}
+        self._recompute_quality_cache()
+        self._update_labels()
+
+    def _recompute_quality_cache(self):
+        """Build the (label text, color) shown on each lead's axis"""
+        self._quality_cache = {}
+        lead_qualities = self._quality_scores.get("lead_quality", {})
+        for lead, lead_quality in lead_qualities.items():
+            problems = []
+            # nk_quality is None when the lead's quality analysis failed
+            nk_quality = lead_quality.get("nk_quality")
+            nk_text = "N/A" if nk_quality is None else f"{nk_quality:.2f}"
+            quality_text = f"{lead} ({nk_text})"
+
+            if lead_quality.get("Low_SNR"):
+                color = "#ff6b6b"  # Red for poor quality
+            elif lead_quality.get("Muscle_Artifact") or lead_quality.get(
+                "Powerline_Interference"
+            ):
+                color = "#ffd93d"  # Yellow for moderate issues
+            else:
+                color = "#6bff6b"  # Green for good quality
+
+            if lead_quality.get("Muscle_Artifact"):
+                problems.append("MA")
+            if lead_quality.get("Powerline_Interference"):
+                problems.append("PI")
+            if lead_quality.get("Baseline_Drift"):
+                problems.append("BD")
+            if lead_quality.get("Bad_Electrode_Contact"):
+                problems.append("EC")
+
+            if problems:
+                quality_text += f" [{', '.join(problems)}]"
+
+            self._quality_cache[lead] = (quality_text, color)
+
+    def _update_labels(self):
+        """
+        Update the text and color of the existing lead labels in place. They
+        are drawn with the next full draw, which the following replot
+        requests; drawing here as well would rasterize the figure twice.
+        """
+        for label, lead in zip(self.labels, _LEAD_FLAT):
+            text, color = self._quality_cache.get(lead, (lead, "white"))
+            label.set_text(text)
+            label.set_color(color)
+
+    def set_config(self, config: Optional[Dict[str, Any]]):
+        """Replace the analysis configuration and refresh the settings display"""
+        self.config = config or {}
+        self._cfg_name_cache = None
+        self._settings_html_cache = None
+        self.update_settings_display()
+
     def update_settings_display(self):
         """Update the settings display label with current configuration"""
+        if self._settings_html_cache is None:
+            self._settings_html_cache = self._build_settings_html()
+        self.settings_label.setText(self._settings_html_cache)
+
+    def _build_settings_html(self) -> str:
         if self.config:
             settings_text = ""
             settings_text += (
@@ -366,12 +1536,16 @@ class EcgTab(QWidget):
             else:
                 settings_text += "<b>Processing:</b> None"
 
-            self.settings_label.setText(settings_text)
-        else:
-            self.settings_label.setText("<i>No analysis configuration</i>")
+            return settings_text
+        return "<i>No analysis configuration</i>"
 
     def get_configuration_name(self):
         """Generate a descriptive name for the current configuration"""
+        if self._cfg_name_cache is None:
+            self._cfg_name_cache = self._build_cfg_name()
+        return self._cfg_name_cache
+
+    def _build_cfg_name(self) -> str:
         if not self.config:
             return "Default"
 
@@ -403,168 +1577,42 @@ class EcgTab(QWidget):
 
         return f"{clean}-{peak}{filter_part}_HP{hp_type}{option_part}"
 
+    @pyqtSlot()
     def update_plot(self):
         """Update the plot based on the selected signal type"""
         if hasattr(self, "ecg_glove") and self.ecg_glove:
-            self.plot_ecg_data()
+            if self.lines:
+                self._refresh_signals()
+            else:
+                self.plot_ecg_data()
+
+    def _selected_signals(self) -> Dict[str, np.ndarray]:
+        """Signals of the selected type, keyed by lead in axis order."""
+        signal_type = self.signal_type_combo.currentText().lower()
+        if signal_type == "raw":
+            source = self.ecg_glove.raw_signals
+        elif signal_type == "filtered":
+            source = self.ecg_glove.lead_signals
+        else:  # cleaned
+            source = self.ecg_glove.cleaned_signals
+
+        return {lead: source.get(lead, _EMPTY_SIGNAL) for lead in _LEAD_FLAT}
+
+    def _refresh_signals(self):
+        """Swap the selected signals into the existing lines without a rebuild."""
+        self._set_line_data(self._selected_signals())
+
+        # Only the lines changed; the cached backgrounds are still valid
+        self._blit_lines()
 
     def plot_ecg_data(self):
         if not self.ecg_glove:
             return
+        if self.canvas is None:
+            self._needs_plot = True  # Plotted once the tab is first shown
+            return
 
-        signal_type = self.signal_type_combo.currentText().lower()
-        self.figure.clear()
-
-        # Fixed lead order for 6x2 layout
-        lead_order = [
-            ("I", "V1"),
-            ("II", "V2"),
-            ("III", "V3"),
-            ("aVR", "V4"),
-            ("aVL", "V5"),
-            ("aVF", "V6"),
-        ]
-
-        # Get quality scores
-        quality_scores = getattr(self, "quality_scores", {}).get("lead_quality", {})
-
-        # Create figure with 6 rows and 2 columns
-        self.axes = []
-        self.signals_data = {}
-
-        # Pre-calculate signal data
-        max_time = 0
-        for row_leads in lead_order:
-            for lead in row_leads:
-                # Select signal based on type
-                if signal_type == "raw":
-                    signal = self.ecg_glove.raw_signals.get(lead, np.array([]))
-                elif signal_type == "filtered":
-                    signal = self.ecg_glove.lead_signals.get(lead, np.array([]))
-                else:  # cleaned
-                    signal = self.ecg_glove.cleaned_signals.get(lead, np.array([]))
-
-                if signal.size > 0:
-                    # Downsample for very large signals (> 10000 points)
-                    if signal.size > 10000:
-                        downsample_factor = signal.size // 10000 + 1
-                        signal = signal[::downsample_factor]
-
-                    times = np.arange(signal.size) / self.ecg_glove.sampling_rate
-                    max_time = max(max_time, times[-1] if times.size > 0 else 0)
-                    self.signals_data[lead] = (times, signal)
-                else:
-                    self.signals_data[lead] = (np.array([]), np.array([]))
-
-        # Set up the figure for maximum space utilization
-        self.figure.subplots_adjust(
-            left=0.02, right=0.98, bottom=0.02, top=0.98, hspace=0.1, wspace=0.1
-        )
-
-        # Create subplots with minimal styling - only share x-axis, not y-axis
-        first_ax = None
-        for row, (left_lead, right_lead) in enumerate(lead_order):
-            # Left plot
-            if first_ax is None:
-                ax_left = self.figure.add_subplot(6, 2, 2 * row + 1)
-                first_ax = ax_left
-            else:
-                ax_left = self.figure.add_subplot(6, 2, 2 * row + 1, sharex=first_ax)
-
-            # Right plot - only share x-axis with first_ax
-            ax_right = self.figure.add_subplot(6, 2, 2 * row + 2, sharex=first_ax)
-
-            self.axes.extend([ax_left, ax_right])
-
-            # Configure axes for maximum signal visibility
-            for ax, lead in [(ax_left, left_lead), (ax_right, right_lead)]:
-                times, signal = self.signals_data[lead]
-                if signal.size > 0:
-                    ax.plot(
-                        times,
-                        signal,
-                        color=DEFAULT_SIGNAL_COLOR,
-                        linewidth=0.8,
-                        antialiased=True,
-                    )
-
-                    # Set individual y-limits for this lead
-                    y_min = np.min(signal)
-                    y_max = np.max(signal)
-                    y_range = y_max - y_min
-                    if y_range > 0:
-                        y_min -= 0.1 * y_range
-                        y_max += 0.1 * y_range
-                    else:
-                        y_min -= 0.1
-                        y_max += 0.1
-                    ax.set_ylim(y_min, y_max)
-
-                    # Add lead label with quality information
-                    if lead in quality_scores:
-                        problems = []
-                        lead_quality = quality_scores[lead]
-                        quality_text = (
-                            f"{lead} ({lead_quality.get('nk_quality', 'N/A'):.2f})"
-                        )
-
-                        if lead_quality.get("Low_SNR"):
-                            color = "#ff6b6b"  # Red for poor quality
-                        elif lead_quality.get("Muscle_Artifact") or lead_quality.get(
-                            "Powerline_Interference"
-                        ):
-                            color = "#ffd93d"  # Yellow for moderate issues
-                        else:
-                            color = "#6bff6b"  # Green for good quality
-
-                        if lead_quality.get("Muscle_Artifact"):
-                            problems.append("MA")
-                        if lead_quality.get("Powerline_Interference"):
-                            problems.append("PI")
-                        if lead_quality.get("Baseline_Drift"):
-                            problems.append("BD")
-                        if lead_quality.get("Bad_Electrode_Contact"):
-                            problems.append("EC")
-
-                        if problems:
-                            quality_text += f" [{', '.join(problems)}]"
-
-                        ax.text(
-                            0.02,
-                            0.85,
-                            quality_text,
-                            transform=ax.transAxes,
-                            fontsize=8,
-                            color=color,
-                            alpha=0.8,
-                        )
-                    else:
-                        ax.text(
-                            0.02,
-                            0.85,
-                            lead,
-                            transform=ax.transAxes,
-                            fontsize=8,
-                            color="white",
-                            alpha=0.8,
-                        )
-
-                # Remove all unnecessary elements
-                ax.set_xticks([])
-                ax.set_yticks([])
-                ax.grid(True, alpha=0.1, color=DEFAULT_GRID_COLOR)
-                for spine in ax.spines.values():
-                    spine.set_visible(False)
-
-        # Set x-limits for all plots and connect zoom/pan events
-        if first_ax:
-            first_ax.set_xlim(0, max(max_time, 1))
-
-            # Connect the xlim_changed event to sync function
-            first_ax.callbacks.connect("xlim_changed", self._sync_xlim)
-
-        # No need for tight_layout since we're using subplots_adjust
-        self.canvas.draw_idle()
+        self.show_signals(self._selected_signals())
 
 
 class EcgAnalyzerGUI(QMainWindow):
@@ -575,145 +1623,20 @@ class EcgAnalyzerGUI(QMainWindow):
 
         # Initialize attributes
         self.current_file = None
+        self._folder_cache: Dict[str, Tuple[int, List[Tuple[str, str]]]] = {}
         self.tabs = {}  # Store tabs by filepath
+        self._tab_to_key: Dict[int, str] = {}  # id(tab) -> key in self.tabs
+
+        # Tabs waiting to be plotted; bursts of finished analyses are
+        # coalesced into one plot per tab
+        self._plot_pending: Set[EcgTab] = set()
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setSingleShot(True)
+        self._plot_timer.setInterval(50)
+        self._plot_timer.timeout.connect(self._flush_plots)
         self.lead_checks = {}
         self.filter_checks = {}
 
-        # Set dark theme for the application
-        self.setStyleSheet(
-            """
-            QMainWindow, QWidget {
-                background-color: #2b2b2b;
-                color: #e0e0e0;
-            }
-            QLabel {
-                color: #e0e0e0;
-                background-color: transparent;
-            }
-            QPushButton {
-                background-color: #3b3b3b;
-                color: #e0e0e0;
-                border: 1px solid #505050;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #454545;
-            }
-            QGroupBox {
-                color: #e0e0e0;
-                background-color: #2b2b2b;
-                border: 1px solid #505050;
-                border-radius: 5px;
-                margin-top: 15px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                color: #e0e0e0;
-                background-color: transparent;
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-                margin-left: 8px;
-                font-weight: bold;
-            }
-            QGroupBox::indicator {
-                width: 13px;
-                height: 13px;
-                margin-left: 5px;
-            }
-            QGroupBox::indicator:unchecked {
-                border: 1px solid #505050;
-                background-color: #2b2b2b;
-            }
-            QGroupBox::indicator:checked {
-                border: 1px solid #4a9eff;
-                background-color: #4a9eff;
-            }
-            QComboBox {
-                background-color: #3b3b3b;
-                color: #e0e0e0;
-                border: 1px solid #505050;
-                border-radius: 3px;
-                padding: 5px;
-                margin-top: 5px;
-                font-size: 11px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #e0e0e0;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3b3b3b;
-                color: #e0e0e0;
-                border: 1px solid #505050;
-                selection-background-color: #4a9eff;
-            }
-            QListWidget {
-                background-color: #2b2b2b;
-                color: #e0e0e0;
-                border: 1px solid #505050;
-            }
-            QCheckBox {
-                color: #e0e0e0;
-                background-color: transparent;
-            }
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: 1px solid #505050;
-            }
-            QScrollArea QWidget {
-                background-color: #2b2b2b;
-            }
-            QScrollArea QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollArea QScrollBar::handle:vertical {
-                background-color: #606060;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollArea QScrollBar::handle:vertical:hover {
-                background-color: #707070;
-            }
-            QTabWidget::pane {
-                background-color: #2b2b2b;
-                border: 1px solid #505050;
-            }
-            QTabBar::tab {
-                background-color: #3b3b3b;
-                color: #e0e0e0;
-                padding: 5px;
-                border: 1px solid #505050;
-            }
-            QTabBar::tab:selected {
-                background-color: #454545;
-            }
-            QSplitter::handle {
-                background-color: #505050;
-            }
-            QSplitter::handle:horizontal {
-                width: 3px;
-                background-color: #505050;
-            }
-            QSplitter::handle:vertical {
-                height: 3px;
-                background-color: #505050;
-            }
-            QSplitter::handle:hover {
-                background-color: #606060;
-            }
-            """
-        )
         # Create main widget and layout
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -869,26 +1792,7 @@ class EcgAnalyzerGUI(QMainWindow):
 
         # Analysis button
         self.process_btn = QPushButton("Process")
-        self.process_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4a9eff;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 10px 0;
-            }
-            QPushButton:hover {
-                background-color: #5ba8ff;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-                color: #999999;
-            }
-        """
-        )
+        self.process_btn.setObjectName("processButton")
         self.process_btn.clicked.connect(self.process_data)
         self.process_btn.setEnabled(False)
 
@@ -902,7 +1806,7 @@ class EcgAnalyzerGUI(QMainWindow):
 
         # Add version label
         version_label = QLabel(f"ECG Analyzer {APP_VERSION}")
-        version_label.setStyleSheet("color: #808080; font-size: 10px; padding: 5px;")
+        version_label.setObjectName("versionLabel")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         sidebar_layout.addWidget(version_label)
 
@@ -914,9 +1818,6 @@ class EcgAnalyzerGUI(QMainWindow):
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
 
-        # Set dark theme for plots
-        plt.style.use("dark_background")
-
         # Add widgets to splitter
         splitter.addWidget(sidebar_scroll)
         splitter.addWidget(self.tab_widget)
@@ -924,18 +1825,40 @@ class EcgAnalyzerGUI(QMainWindow):
         # Set initial splitter sizes (smaller sidebar, more space for plots)
         splitter.setSizes([320, 1000])
 
+    @pyqtSlot()
     def select_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
             self.file_list.clear()
-            # list and sort by filename, display basename only
-            ret_files = sorted([f for f in os.listdir(folder) if f.endswith(".ret")])
-            for fname in ret_files:
-                item = QListWidgetItem(fname)
-                # store full path for later retrieval
-                item.setData(USER_ROLE, os.path.join(folder, fname))
-                self.file_list.addItem(item)
+            entries = self._list_ret_files(folder)
+            self.file_list.setUpdatesEnabled(False)
+            try:
+                # one model insert for all names, display basename only
+                self.file_list.addItems([name for name, _ in entries])
+                for row, (_, path) in enumerate(entries):
+                    # store full path for later retrieval
+                    self.file_list.item(row).setData(USER_ROLE, path)
+            finally:
+                self.file_list.setUpdatesEnabled(True)
+
+    def _list_ret_files(self, folder: str) -> List[Tuple[str, str]]:
+        """
+        (name, path) of the regular .ret files in folder, sorted by name.
+        Reused while the folder's modification time is unchanged.
+        """
+        mtime = os.stat(folder).st_mtime_ns
+        cached = self._folder_cache.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with os.scandir(folder) as it:
+            entries = sorted(
+                (e.name, e.path) for e in it if e.name.endswith(".ret") and e.is_file()
+            )
+        self._folder_cache[folder] = (mtime, entries)
+        return entries
 
+    @pyqtSlot()
     def file_selected(self):
         items = self.file_list.selectedItems()
         if items:
@@ -949,18 +1872,37 @@ class EcgAnalyzerGUI(QMainWindow):
     def get_selected_leads(self):
         return [lead for lead, cb in self.lead_checks.items() if cb.isChecked()]
 
+    def closeEvent(self, event):
+        # Drop the queued analyses and let the running ones finish, without
+        # reporting back, before their result signals go away
+        pool = QThreadPool.globalInstance()
+        pool.clear()
+        for tab in self.tabs.values():
+            if tab.analysis_job is not None:
+                tab.analysis_job.cancelled = True
+        pool.waitForDone()
+        # No analysis is writing to the disk cache any more
+        _MEM.reduce_size(bytes_limit=CACHE_BYTES_LIMIT)
+        super().closeEvent(event)
+
+    @pyqtSlot(int)
     def close_tab(self, index):
         tab = self.tab_widget.widget(index)
-        # Find the key in self.tabs that corresponds to this tab
-        key_to_remove = None
-        for key, stored_tab in self.tabs.items():
-            if stored_tab == tab:
-                key_to_remove = key
-                break
-        if key_to_remove:
-            del self.tabs[key_to_remove]
+        key = self._tab_to_key.pop(id(tab), None)
+        self.tabs.pop(key, None)
         self.tab_widget.removeTab(index)
 
+        # Drop its analysis if still queued (a running one is ignored when it
+        # reports back) and release the widget with its figure
+        job = tab.analysis_job
+        if job is not None:
+            job.cancelled = True
+            if QThreadPool.globalInstance().tryTake(job):
+                job.signals.deleteLater()
+        tab.analysis_job = None
+        tab.deleteLater()
+
+    @pyqtSlot()
     def process_data(self):
         if not self.current_file:
             return
@@ -983,8 +1925,6 @@ class EcgAnalyzerGUI(QMainWindow):
 
             # Get high-pass filter type
             hp_text = self.hp_filter_type.currentText()
-            from ecg_filters import HPFilterType
-
             hp_type_mapping = {
                 "0.05 Hz": HPFilterType.HP005,
                 "0.15 Hz": HPFilterType.HP015,
@@ -1022,177 +1962,88 @@ class EcgAnalyzerGUI(QMainWindow):
             if config_key not in self.tabs:
                 tab = EcgTab(self.current_file, config=config)
                 self.tabs[config_key] = tab
+                self._tab_to_key[id(tab)] = config_key
                 tab_name = f"{os.path.basename(self.current_file)} ({tab.get_configuration_name()})"
                 self.tab_widget.addTab(tab, tab_name)
             else:
                 tab = self.tabs[config_key]
 
-            # Load and decode data
-            with open(self.current_file, "rb") as f:
-                data_bytes = f.read()
-
-            # Get selected methods from dropdowns
-            clean_method = self.clean_method.currentText()
-            peak_method = self.peak_method.currentText()
-
-            # Get enhanced filter selections
-            filters = []
-            if self.filter_50hz.isChecked():
-                filters.append(50)
-            if self.filter_60hz.isChecked():
-                filters.append(60)
-            if self.filter_100hz.isChecked():
-                filters.append(100)
-            if self.filter_120hz.isChecked():
-                filters.append(120)
-
-            # Get high-pass filter type
-            hp_text = self.hp_filter_type.currentText()
-            from ecg_filters import HPFilterType
-
-            hp_type_mapping = {
-                "0.05 Hz": HPFilterType.HP005,
-                "0.15 Hz": HPFilterType.HP015,
-                "0.5 Hz": HPFilterType.HP05,
+            glove_kwargs = {
+                "sampling_rate": 500,
+                "clean_method": clean_method,
+                "peak_method": peak_method,
+                "filters": filters,
+                "spike_removal": spike_removal,
+                "hp_filter_type": hp_filter_type,
+                "powerline_freq": 60,  # Default, will be overridden by filters list
+                "enable_baseline_correction": baseline_correction,
+                "enable_smoothing": signal_smoothing,
+                "smoothing_window": smoothing_window,
             }
-            hp_filter_type = hp_type_mapping.get(hp_text, HPFilterType.HP015)
 
-            # Get additional processing options
-            spike_removal = self.spike_removal.isChecked()
-            baseline_correction = self.baseline_correction.isChecked()
-            signal_smoothing = self.signal_smoothing.isChecked()
-            smoothing_window = int(self.smoothing_window.currentText())
-
-            tab.ecg_glove = EcgGlove(
-                sampling_rate=500,
-                clean_method=clean_method,
-                peak_method=peak_method,
-                filters=filters,
-                spike_removal=spike_removal,
-                hp_filter_type=hp_filter_type,
-                powerline_freq=60,  # Default, will be overridden by filters list
-                enable_baseline_correction=baseline_correction,
-                enable_smoothing=signal_smoothing,
-                smoothing_window=smoothing_window,
-            )
-            tab.ecg_glove.decode_data(data_bytes)
-
-            # Analyze quality first
-            quality_results = tab.ecg_glove.compute_quality()
-
-            # Store quality scores and measurement results
-            tab.quality_scores = quality_results
-
-            # Analyze ECG if quality is acceptable
-            results = tab.ecg_glove.process()
-
-            # Format results for display with HTML formatting in two columns
-            result_text = """
-            <table style='width: 100%; border-collapse: collapse;'>
-                <tr>
-                    <td style='width: 50%; vertical-align: top; padding-right: 10px;'>
-                        <b>Analysis Lead:</b> {analysis_lead}<br>
-                        <br>
-                        <b>Measurements:</b><br>
-                        {measurements}
-                    </td>
-                    <td style='width: 50%; vertical-align: top; padding-left: 10px;'>
-                        <b>Signal Quality:</b> {quality}<br>
-                        <br>
-                        <b>Electrical Axes:</b><br>
-                        {axes}
-                    </td>
-                </tr>
-            </table>
-            """
-
-            # Prepare data for formatting
-            analysis_lead = results["AnalysisLead"]
-
-            # Prepare measurements
-            measurements_list = []
-            if "ecgData" in results and "measurements" in results["ecgData"]:
-                measurements = results["ecgData"]["measurements"]
-
-                if measurements.get("HeartRate_BPM"):
-                    measurements_list.append(
-                        f"<b>HR:</b> {measurements['HeartRate_BPM']:.1f} BPM"
-                    )
-                if measurements.get("RR_Interval_ms"):
-                    measurements_list.append(
-                        f"<b>RR:</b> {measurements['RR_Interval_ms']:.0f} ms"
-                    )
-                if measurements.get("P_Duration_ms"):
-                    measurements_list.append(
-                        f"<b>P:</b> {measurements['P_Duration_ms']:.0f} ms"
-                    )
-                if measurements.get("PR_Interval_ms"):
-                    measurements_list.append(
-                        f"<b>PR:</b> {measurements['PR_Interval_ms']:.0f} ms"
-                    )
-                if measurements.get("QRS_Duration_ms"):
-                    measurements_list.append(
-                        f"<b>QRS:</b> {measurements['QRS_Duration_ms']:.0f} ms"
-                    )
-                if measurements.get("QT_Interval_ms"):
-                    measurements_list.append(
-                        f"<b>QT:</b> {measurements['QT_Interval_ms']:.0f} ms"
-                    )
-                if measurements.get("QTc_Interval_ms"):
-                    measurements_list.append(
-                        f"<b>QTc:</b> {measurements['QTc_Interval_ms']:.0f} ms"
-                    )
-
-            measurements_text = (
-                "<br>".join(measurements_list)
-                if measurements_list
-                else "No measurements available"
+            # Repeating the request still pending for this tab (e.g. a double
+            # click) keeps that job instead of queueing the same work again
+            pending = tab.analysis_job
+            if (
+                pending is not None
+                and pending.filepath == self.current_file
+                and pending.glove_kwargs == glove_kwargs
+            ):
+                self.tab_widget.setCurrentWidget(tab)
+                return
+
+            # A new request supersedes one still pending for this tab: pull it
+            # from the queue if it has not started, otherwise it does not
+            # report its result
+            pool = QThreadPool.globalInstance()
+            if tab.analysis_job is not None:
+                tab.analysis_job.cancelled = True
+                if pool.tryTake(tab.analysis_job):
+                    tab.analysis_job.signals.deleteLater()
+
+            # Load, decode and analyze on the thread pool (reused from the
+            # on-disk cache if the file and configuration are unchanged). A
+            # tab keeps showing its results while they are re-analyzed: they
+            # are usually unchanged, and setText skips identical text, so the
+            # results panel is not laid out again
+            if tab._last_result is None:
+                tab.results_text.setText("Analyzing...")
+            job = AnalysisJob(self.current_file, glove_kwargs, AnalysisSignals(self))
+            job.signals.finished.connect(
+                lambda result: self._analysis_finished(tab, job, result)
             )
+            job.signals.failed.connect(lambda msg: self._analysis_failed(tab, job, msg))
+            tab.analysis_job = job
+            pool.start(job)
 
-            # Prepare axes
-            axes_list = []
-            if "ecgData" in results and "measurements" in results["ecgData"]:
-                measurements = results["ecgData"]["measurements"]
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Analysis failed: {str(e)}")
 
-                if measurements.get("P_Axis") is not None:
-                    axes_list.append(f"<b>P:</b> {measurements['P_Axis']:.0f}°")
-                if measurements.get("QRS_Axis") is not None:
-                    axes_list.append(f"<b>QRS:</b> {measurements['QRS_Axis']:.0f}°")
-                if measurements.get("T_Axis") is not None:
-                    axes_list.append(f"<b>T:</b> {measurements['T_Axis']:.0f}°")
+    def _analysis_finished(self, tab, job, result):
+        """Show the results of an AnalysisJob in its tab (GUI thread)."""
+        job.signals.deleteLater()
+        if id(tab) not in self._tab_to_key or tab.analysis_job is not job:
+            return  # Tab was closed or a newer analysis has been requested
+        tab.analysis_job = None
 
-            axes_text = (
-                "<br>".join(axes_list) if axes_list else "No axis data available"
-            )
+        try:
+            tab.ecg_glove, quality_results, results = result
 
-            # Prepare quality
-            quality_text = ""
-            if "overall_quality" in quality_results:
-                overall_quality = quality_results["overall_quality"]
-                if isinstance(overall_quality, (int, float)):
-                    quality_color = (
-                        "#6bff6b"
-                        if overall_quality > 0.7
-                        else "#ffd93d" if overall_quality > 0.4 else "#ff6b6b"
-                    )
-                    quality_text = f"<span style='color: {quality_color}'>{overall_quality:.2f}</span>"
-                else:
-                    quality_text = str(overall_quality)
-            else:
-                quality_text = "Not available"
-
-            # Format the final result text
-            result_text = result_text.format(
-                analysis_lead=analysis_lead,
-                measurements=measurements_text,
-                quality=quality_text,
-                axes=axes_text,
-            )
+            # Store quality scores and measurement results
+            tab.quality_scores = quality_results
 
-            tab.results_text.setText(result_text)
+            # Rebuild the results HTML only for a new result (a cached one
+            # comes back as the same object)
+            if result is not tab._last_result:
+                tab._last_result = result
+                tab._last_results_html = _format_results_html(
+                    quality_results, results
+                )
+            tab.results_text.setText(tab._last_results_html)
 
-            # Update plots
-            self.plot_ecg_data(tab)
+            # Update plots (coalesced with other pending updates)
+            self._plot_pending.add(tab)
+            self._plot_timer.start()
 
             # Switch to the tab
             self.tab_widget.setCurrentWidget(tab)
@@ -1200,170 +2051,42 @@ class EcgAnalyzerGUI(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Analysis failed: {str(e)}")
 
+    def _analysis_failed(self, tab, job, message):
+        job.signals.deleteLater()
+        if tab.analysis_job is not job:
+            return
+        tab.analysis_job = None
+        QMessageBox.critical(self, "Error", f"Analysis failed: {message}")
+
+    @pyqtSlot()
+    def _flush_plots(self):
+        """Plot every tab queued since the last flush, once each."""
+        pending, self._plot_pending = self._plot_pending, set()
+        for tab in pending:
+            if id(tab) in self._tab_to_key:  # skip tabs closed meanwhile
+                self.plot_ecg_data(tab)
+
     def plot_ecg_data(self, tab):
         if not tab.ecg_glove:
             return
-        # Skip plotting if no signal data available
-        if not any(arr.size > 0 for arr in tab.ecg_glove.cleaned_signals.values()):
-            tab.figure.clear()
-            tab.canvas.draw_idle()
+        if tab.canvas is None:
+            tab._needs_plot = True  # Plotted once the tab is first shown
             return
 
-        tab.figure.clear()
-
-        # Fixed lead order for 6x2 layout
-        lead_order = [
-            ("I", "V1"),
-            ("II", "V2"),
-            ("III", "V3"),
-            ("aVR", "V4"),
-            ("aVL", "V5"),
-            ("aVF", "V6"),
-        ]
-
-        # Get quality scores
-        quality_scores = (
-            tab.quality_scores.get("lead_quality", {})
-            if hasattr(tab, "quality_scores")
-            else {}
-        )
-
-        # Create figure with 6 rows and 2 columns
-        tab.axes = []
-        tab.signals_data = {}
-
-        # Pre-calculate signal data
-        max_time = 0
-        for row_leads in lead_order:
-            for lead in row_leads:
-                signal = tab.ecg_glove.cleaned_signals.get(lead, np.array([]))
-                if signal.size > 0:
-                    # Downsample for very large signals (> 10000 points)
-                    if signal.size > 10000:
-                        downsample_factor = signal.size // 10000 + 1
-                        signal = signal[::downsample_factor]
-
-                    times = np.arange(signal.size) / tab.ecg_glove.sampling_rate
-                    max_time = max(max_time, times[-1] if times.size > 0 else 0)
-                    tab.signals_data[lead] = (times, signal)
-                else:
-                    tab.signals_data[lead] = (np.array([]), np.array([]))
-
-        # Set up the figure for maximum space utilization
-        tab.figure.subplots_adjust(
-            left=0.02, right=0.98, bottom=0.02, top=0.98, hspace=0.1, wspace=0.1
+        cleaned = tab.ecg_glove.cleaned_signals
+        tab.show_signals(
+            {lead: cleaned.get(lead, _EMPTY_SIGNAL) for lead in _LEAD_FLAT}
         )
 
-        # Create subplots with minimal styling - only share x-axis, not y-axis
-        first_ax = None
-        for row, (left_lead, right_lead) in enumerate(lead_order):
-            # Left plot
-            if first_ax is None:
-                ax_left = tab.figure.add_subplot(6, 2, 2 * row + 1)
-                first_ax = ax_left
-            else:
-                ax_left = tab.figure.add_subplot(6, 2, 2 * row + 1, sharex=first_ax)
-
-            # Right plot - only share x-axis with first_ax
-            ax_right = tab.figure.add_subplot(6, 2, 2 * row + 2, sharex=first_ax)
-
-            tab.axes.extend([ax_left, ax_right])
-
-            # Configure axes for maximum signal visibility
-            for ax, lead in [(ax_left, left_lead), (ax_right, right_lead)]:
-                times, signal = tab.signals_data[lead]
-                if signal.size > 0:
-                    ax.plot(
-                        times,
-                        signal,
-                        color=DEFAULT_SIGNAL_COLOR,
-                        linewidth=0.8,
-                        antialiased=True,
-                    )
-
-                    # Set individual y-limits for this lead
-                    y_min = np.min(signal)
-                    y_max = np.max(signal)
-                    y_range = y_max - y_min
-                    if y_range > 0:
-                        y_min -= 0.1 * y_range
-                        y_max += 0.1 * y_range
-                    else:
-                        y_min -= 0.1
-                        y_max += 0.1
-                    ax.set_ylim(y_min, y_max)
-
-                    # Add lead label with quality information
-                    if lead in quality_scores:
-                        problems = []
-                        lead_quality = quality_scores[lead]
-                        quality_text = (
-                            f"{lead} ({lead_quality.get('nk_quality', 'N/A'):.2f})"
-                        )
-
-                        if lead_quality.get("Low_SNR"):
-                            color = "#ff6b6b"  # Red for poor quality
-                        elif lead_quality.get("Muscle_Artifact") or lead_quality.get(
-                            "Powerline_Interference"
-                        ):
-                            color = "#ffd93d"  # Yellow for moderate issues
-                        else:
-                            color = "#6bff6b"  # Green for good quality
-
-                        if lead_quality.get("Muscle_Artifact"):
-                            problems.append("MA")
-                        if lead_quality.get("Powerline_Interference"):
-                            problems.append("PI")
-                        if lead_quality.get("Baseline_Drift"):
-                            problems.append("BD")
-                        if lead_quality.get("Bad_Electrode_Contact"):
-                            problems.append("EC")
-
-                        if problems:
-                            quality_text += f" [{', '.join(problems)}]"
-
-                        ax.text(
-                            0.02,
-                            0.85,
-                            quality_text,
-                            transform=ax.transAxes,
-                            fontsize=8,
-                            color=color,
-                            alpha=0.8,
-                        )
-                    else:
-                        ax.text(
-                            0.02,
-                            0.85,
-                            lead,
-                            transform=ax.transAxes,
-                            fontsize=8,
-                            color="white",
-                            alpha=0.8,
-                        )
-
-                # Remove all unnecessary elements
-                ax.set_xticks([])
-                ax.set_yticks([])
-                ax.grid(True, alpha=0.1, color=DEFAULT_GRID_COLOR)
-                for spine in ax.spines.values():
-                    spine.set_visible(False)
-
-        # Set x-limits for all plots and connect zoom/pan events
-        if first_ax:
-            first_ax.set_xlim(0, max(max_time, 1))
-
-            # Connect the xlim_changed event to sync function
-            first_ax.callbacks.connect("xlim_changed", tab._sync_xlim)
-
-        # No need for tight_layout since we're using subplots_adjust
-        tab.canvas.draw_idle()
-
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(_MAIN_QSS + _COMBO_QSS + _WIDGET_QSS)
     window = EcgAnalyzerGUI()
     window.show()
+    # Import the analysis stack and compile the plot kernels in the
+    # background while the user picks a file
+    QThreadPool.globalInstance().start(_warm_up)
     sys.exit(app.exec_())
 
 
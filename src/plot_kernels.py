@@ -0,0 +1,66 @@
+"""
+Compiled min/max envelope kernels for the signal plots. They are compiled,
+or loaded from numba's on-disk cache, when this module is imported, so the
+GUI imports it on a worker thread rather than on its first plot.
+Requires numba.
+"""
+import numpy as np
+from numba import njit, types
+
+_FLOAT32_IN = types.Array(types.float32, 1, "C", readonly=True)
+_FLOAT32_OUT = types.Array(types.float32, 1, "C")
+
+
+@njit(types.void(_FLOAT32_IN, types.intp, _FLOAT32_OUT), cache=True)
+def envelope(signal, bucket, out):
+    """
+    Single-pass min/max per bucket, written interleaved into out. NaN
+    propagates into its bucket's min and max, as with ndarray.min/max.
+    """
+    n = signal.size
+    for b in range(out.size // 2):
+        start = b * bucket
+        stop = min(start + bucket, n)
+        lo = signal[start]
+        hi = lo
+        for i in range(start + 1, stop):
+            v = signal[i]
+            if v < lo or v != v:
+                lo = v
+            if v > hi or v != v:
+                hi = v
+        out[2 * b] = lo
+        out[2 * b + 1] = hi
+
+
+@njit(
+    types.void(
+        types.Array(types.float64, 1, "C", readonly=True),
+        types.intp,
+        _FLOAT32_OUT,
+        _FLOAT32_OUT,
+    ),
+    cache=True,
+)
+def prepare(signal, bucket, src, env):
+    """
+    Cast signal into the float32 buffer src and write its min/max
+    envelope into env, reading every sample once. NaN propagates like in
+    envelope().
+    """
+    n = signal.size
+    for b in range(env.size // 2):
+        start = b * bucket
+        stop = min(start + bucket, n)
+        lo = np.float32(signal[start])
+        hi = lo
+        src[start] = lo
+        for i in range(start + 1, stop):
+            v = np.float32(signal[i])
+            src[i] = v
+            if v < lo or v != v:
+                lo = v
+            if v > hi or v != v:
+                hi = v
+        env[2 * b] = lo
+        env[2 * b + 1] = hi